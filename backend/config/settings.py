@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'lxp',
 ]
@@ -84,10 +85,49 @@ DATABASES = {
         'PASSWORD': os.getenv('DATABASE_PASSWORD', 'postgres'),
         'HOST': os.getenv('DATABASE_HOST', 'db'),
         'PORT': os.getenv('DATABASE_PORT', '5432'),
+        # Reuse connections across requests instead of reconnecting every time
+        'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Bind parameters server-side and let psycopg prepare any statement a connection
+            # runs 5 times (e.g. progress updates), so Postgres reuses its plan. Set
+            # DATABASE_PREPARE_THRESHOLD=0 to turn this off behind a transaction-mode pooler
+            'server_side_binding': True,
+            'prepare_threshold': int(os.getenv('DATABASE_PREPARE_THRESHOLD', '5') or 0) or None,
+        },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Celery
+# https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+
+CELERY_BROKER_URL = REDIS_URL
+CELERY_TASK_IGNORE_RESULT = True
+# Without a broker, run tasks inline so local development works without a worker
+CELERY_TASK_ALWAYS_EAGER = not REDIS_URL
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -1,4 +1,10 @@
 from django.contrib import admin
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.contrib.postgres.search import SearchQuery
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
 from .models import (
     Student,
     Educator,
@@ -16,18 +22,96 @@ from .models import (
 )
 
 
+class ApproxCountPaginator(Paginator):
+    """Use Postgres' row estimate instead of COUNT(*) for unfiltered changelists.
+
+    Small tables still get an exact count, since the estimate is only refreshed by
+    VACUUM/ANALYZE and is coarse when there are few rows.
+    """
+
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.exact_count_threshold:
+                return row[0]
+        return super().count
+
+
+class ChangelistDeferMixin:
+    """Skip loading large columns in the changelist; change forms still load the full row."""
+
+    changelist_defer = []
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        changelist_url_name = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if request.resolver_match and request.resolver_match.url_name == changelist_url_name:
+            queryset = queryset.defer(*self.changelist_defer)
+        return queryset
+
+
+class SearchVectorAdminMixin:
+    """Serve admin search for long text columns from the model's GIN-indexed search_vector.
+
+    Fields listed in ``search_vector_fields`` are matched with a full-text query against
+    ``search_vector``; any other ``search_fields`` keep Django's default icontains lookup.
+    """
+
+    search_vector_fields = []
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        condition = Q(search_vector=SearchQuery(search_term, config='english', search_type='websearch'))
+        may_have_duplicates = False
+        for field_name in self.get_search_fields(request):
+            if field_name in self.search_vector_fields:
+                continue
+            lookup = f'{field_name}__icontains'
+            condition |= Q(**{lookup: search_term})
+            may_have_duplicates |= lookup_spawns_duplicates(self.opts, lookup)
+
+        return queryset.filter(condition), may_have_duplicates
+
+
+class RelatedChoicesMixin:
+    """Load foreign key dropdown choices with what their ``__str__`` reads.
+
+    ``LearningPath.__str__`` follows ``student``, so each option would otherwise cost a
+    query; content choices skip the body and attachment columns.
+    """
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.related_model is LearningPath:
+            kwargs.setdefault('queryset', LearningPath.objects.select_related('student').order_by('-created_at'))
+        elif db_field.related_model is Content:
+            kwargs.setdefault('queryset', Content.objects.list_view())
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
 @admin.register(Student)
 class StudentAdmin(admin.ModelAdmin):
     list_display = ['id', 'full_name', 'email', 'grade_level', 'is_active', 'enrollment_date']
     list_filter = ['grade_level', 'is_active', 'gender']
-    search_fields = ['first_name', 'last_name', 'email']
+    search_fields = ['full_name', 'email']
     ordering = ['-created_at']
 
 
 @admin.register(Educator)
 class EducatorAdmin(admin.ModelAdmin):
     list_display = ['id', 'full_name', 'email', 'department']
-    search_fields = ['first_name', 'last_name', 'email']
+    search_fields = ['full_name', 'email']
     ordering = ['-created_at']
 
 
@@ -40,68 +124,136 @@ class SubjectAdmin(admin.ModelAdmin):
 
 
 @admin.register(Content)
-class ContentAdmin(admin.ModelAdmin):
+class ContentAdmin(ChangelistDeferMixin, SearchVectorAdminMixin, admin.ModelAdmin):
     list_display = ['title', 'subject', 'content_type', 'difficulty_level', 'created_at']
     list_filter = ['content_type', 'difficulty_level', 'subject']
+    list_select_related = ['subject']
     search_fields = ['title', 'description']
+    # Titles keep substring matching, which autocomplete relies on; see the trigram index
+    search_vector_fields = ['description']
+    search_help_text = 'Matches part of the title, or whole words in the description.'
+    changelist_defer = ['description', 'content_body', 'file_attachments', 'search_vector']
     ordering = ['subject', 'difficulty_level', 'title']
 
 
-class ContentAssignmentInline(admin.TabularInline):
+class ContentAssignmentInline(RelatedChoicesMixin, admin.TabularInline):
     model = ContentAssignment
     extra = 1
     ordering = ['order']
+    # A plain select would load every content row once per inline form
+    autocomplete_fields = ['content']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('learning_path', 'content')
 
 
 @admin.register(LearningPath)
 class LearningPathAdmin(admin.ModelAdmin):
     list_display = ['title', 'student', 'subject', 'difficulty_level', 'is_active', 'start_date', 'target_completion_date']
     list_filter = ['difficulty_level', 'is_active', 'subject']
-    search_fields = ['title', 'student__first_name', 'student__last_name']
+    list_select_related = ['student', 'subject']
+    search_fields = ['title', 'student__full_name']
     inlines = [ContentAssignmentInline]
     ordering = ['-created_at']
+    actions = ['refresh_completion']
+
+    def save_formset(self, request, form, formset, change):
+        if formset.model is not ContentAssignment:
+            return super().save_formset(request, form, formset, change)
+
+        formset.save(commit=False)
+        for obj in formset.deleted_objects:
+            obj.delete()
+        # Rows whose only edit is their position go out in one UPDATE instead of a save() each
+        reordered = [obj for obj, changed in formset.changed_objects if changed == ['order']]
+        ContentAssignment.objects.bulk_update(reordered, ['order'])
+        edited = [obj for obj, changed in formset.changed_objects if changed != ['order']]
+        for obj in formset.new_objects + edited:
+            obj.save()
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # Inline assignment edits change the denominator of the stored percentage
+        LearningPath.refresh_completion_percentage(form.instance.pk)
+
+    @admin.action(description="Recalculate completion percentage")
+    def refresh_completion(self, request, queryset):
+        updated = queryset.refresh_completion_percentage()
+        self.message_user(request, f"Recalculated completion for {updated} learning path(s).")
 
 
 @admin.register(ContentAssignment)
-class ContentAssignmentAdmin(admin.ModelAdmin):
+class ContentAssignmentAdmin(RelatedChoicesMixin, admin.ModelAdmin):
     list_display = ['learning_path', 'content', 'order', 'is_required', 'created_at']
     list_filter = ['is_required']
+    list_select_related = ['learning_path__student', 'content']
     search_fields = ['learning_path__title', 'content__title']
-    ordering = ['learning_path', 'order']
+    # Newest paths first; a relation in ordering would otherwise sort by the path's id ascending
+    ordering = ['-learning_path', 'order']
 
 
 @admin.register(Assessment)
-class AssessmentAdmin(admin.ModelAdmin):
+class AssessmentAdmin(RelatedChoicesMixin, ChangelistDeferMixin, SearchVectorAdminMixin, admin.ModelAdmin):
     list_display = ['title', 'subject', 'assessment_type', 'difficulty_level', 'total_points']
     list_filter = ['assessment_type', 'difficulty_level', 'subject']
+    list_select_related = ['subject']
     search_fields = ['title', 'description']
+    # Titles keep substring matching, which autocomplete relies on; see the trigram index
+    search_vector_fields = ['description']
+    search_help_text = 'Matches part of the title, or whole words in the description.'
+    changelist_defer = ['description', 'questions', 'search_vector']
     ordering = ['subject', 'difficulty_level', 'title']
 
 
 @admin.register(Progress)
-class ProgressAdmin(admin.ModelAdmin):
+class ProgressAdmin(RelatedChoicesMixin, admin.ModelAdmin):
     list_display = ['student', 'content', 'status', 'completion_percentage', 'mastery_level', 'score', 'updated_at']
     list_filter = ['status', 'learning_path__subject']
-    search_fields = ['student__first_name', 'student__last_name', 'content__title']
+    list_select_related = ['student', 'content']
+    search_fields = ['student__full_name', 'content__title']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-updated_at']
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
+
+    # The path's stored completion percentage counts these rows, so refresh it after each edit
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # A record moved to another path changes the completion of both
+        path_ids = {obj.learning_path_id, form.initial.get('learning_path')} - {None}
+        LearningPath.objects.filter(pk__in=path_ids).refresh_completion_percentage()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        LearningPath.refresh_completion_percentage(obj.learning_path_id)
+
+    def delete_queryset(self, request, queryset):
+        path_ids = list(queryset.order_by().values_list('learning_path_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        LearningPath.objects.filter(pk__in=path_ids).refresh_completion_percentage()
 
 
 @admin.register(AssessmentResult)
-class AssessmentResultAdmin(admin.ModelAdmin):
+class AssessmentResultAdmin(RelatedChoicesMixin, admin.ModelAdmin):
     list_display = ['student', 'assessment', 'score', 'passed', 'submitted_at', 'graded']
     list_filter = ['passed', 'graded', 'assessment__subject']
-    search_fields = ['student__first_name', 'student__last_name', 'assessment__title']
+    list_select_related = ['student', 'assessment']
+    search_fields = ['student__full_name', 'assessment__title']
     readonly_fields = ['created_at']
     ordering = ['-created_at']
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Attendance)
 class AttendanceAdmin(admin.ModelAdmin):
     list_display = ['student', 'date', 'status', 'created_at']
     list_filter = ['status', 'date']
-    search_fields = ['student__first_name', 'student__last_name']
+    list_select_related = ['student']
+    search_fields = ['student__full_name']
     ordering = ['-date']
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Badge)
@@ -115,14 +267,20 @@ class BadgeAdmin(admin.ModelAdmin):
 class StudentBadgeAdmin(admin.ModelAdmin):
     list_display = ['student', 'badge', 'earned_at']
     list_filter = ['badge']
-    search_fields = ['student__first_name', 'student__last_name', 'badge__name']
+    list_select_related = ['student', 'badge']
+    search_fields = ['student__full_name', 'badge__name']
     ordering = ['-earned_at']
 
 
 @admin.register(AIMentorSession)
-class AIMentorSessionAdmin(admin.ModelAdmin):
-    list_display = ['student', 'session_type', 'learning_path', 'helpful', 'rating', 'created_at']
-    list_filter = ['session_type', 'helpful', 'rating']
-    search_fields = ['student__first_name', 'student__last_name', 'query', 'response']
+class AIMentorSessionAdmin(RelatedChoicesMixin, SearchVectorAdminMixin, admin.ModelAdmin):
+    list_display = ['student', 'session_type', 'learning_path', 'status', 'helpful', 'rating', 'created_at']
+    list_filter = ['session_type', 'status', 'helpful', 'rating']
+    list_select_related = ['student', 'learning_path__student']
+    search_fields = ['student__full_name', 'query', 'response']
+    search_vector_fields = ['query', 'response']
+    search_help_text = 'Matches student names, or whole words in the query and response.'
     readonly_fields = ['created_at']
     ordering = ['-created_at']
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
@@ -1,14 +1,23 @@
 from ninja import NinjaAPI, Schema
 from ninja.pagination import paginate
+from pydantic import field_validator
 from typing import List, Optional
-from datetime import datetime, date
+import hashlib
+from statistics import fmean
+from datetime import datetime, date, timedelta
 from django.shortcuts import get_object_or_404
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.contrib.auth.models import User
-from django.db import models as django_models
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import transaction
+from django.db.models import Avg, Count, F, FloatField, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.http import parse_etags
 
 from .models import (
+    DIFFICULTY_LEVELS,
     Student,
-    Educator,
     Subject,
     Content,
     LearningPath,
@@ -22,11 +31,15 @@ from .models import (
     StudentBadge,
 )
 from .grok_service import grok_service
+from .renderers import ORJSONRenderer
+from .signals import dashboard_version
+from .tasks import generate_learning_path_goals, generate_mentor_response, generate_result_feedback
 
 api = NinjaAPI(
     title="XAI Learning Experience Platform API",
     version="1.0.0",
-    description="AI-native LXP for personalized learning and progress tracking"
+    description="AI-native LXP for personalized learning and progress tracking",
+    renderer=ORJSONRenderer(),
 )
 
 
@@ -68,6 +81,18 @@ class SubjectOutputSchema(Schema):
     grade_level: int
 
 
+class ContentListOutputSchema(Schema):
+    id: int
+    subject_id: int
+    subject_name: str
+    title: str
+    content_type: str
+    description: str
+    difficulty_level: str
+    estimated_duration_minutes: int
+    external_url: Optional[str] = None
+
+
 class ContentOutputSchema(Schema):
     id: int
     subject_id: int
@@ -108,6 +133,13 @@ class LearningPathInputSchema(Schema):
     target_completion_date: date
     content_ids: List[int]  # List of content IDs to assign
 
+    @field_validator('difficulty_level')
+    @classmethod
+    def check_difficulty_level(cls, value):
+        if value not in DIFFICULTY_LEVELS:
+            raise ValueError(f"must be one of {', '.join(sorted(DIFFICULTY_LEVELS))}")
+        return value
+
 
 class ProgressOutputSchema(Schema):
     id: int
@@ -131,6 +163,14 @@ class ProgressInputSchema(Schema):
     mastery_level: Optional[float] = None
     score: Optional[float] = None
 
+    # update_progress writes with QuerySet.update(), which skips the model's choices validation
+    @field_validator('status')
+    @classmethod
+    def check_status(cls, value):
+        if value is not None and value not in Progress.STATUSES:
+            raise ValueError(f"must be one of {', '.join(sorted(Progress.STATUSES))}")
+        return value
+
 
 class AssessmentOutputSchema(Schema):
     id: int
@@ -154,6 +194,16 @@ class AssessmentInputSchema(Schema):
     started_at: datetime
     submitted_at: datetime
 
+    # time_taken_minutes is generated with floor(), which only matches whole elapsed
+    # minutes when the submission doesn't come before the start
+    @field_validator('submitted_at')
+    @classmethod
+    def check_submitted_at(cls, value, info):
+        started_at = info.data.get('started_at')
+        if started_at is not None and value < started_at:
+            raise ValueError("must not be before started_at")
+        return value
+
 
 class AssessmentResultOutputSchema(Schema):
     id: int
@@ -183,6 +233,7 @@ class AIMentorResponseOutputSchema(Schema):
     session_type: str
     query: str
     response: str
+    status: str
     created_at: datetime
 
 
@@ -209,6 +260,55 @@ class LoginResponseSchema(Schema):
     profile_id: int
 
 
+# ============================================================================
+# PROJECTIONS
+# ============================================================================
+
+# Columns selected with .values() for each output schema, so list and detail
+# endpoints hand Ninja plain dicts instead of building them from model instances
+CONTENT_LIST_FIELDS = (
+    'id', 'subject_id', 'title', 'content_type', 'description',
+    'difficulty_level', 'estimated_duration_minutes', 'external_url',
+)
+CONTENT_FIELDS = CONTENT_LIST_FIELDS + ('content_body',)
+
+# Dashboards list many paths and results, so they leave out the long text/JSON columns
+LEARNING_PATH_SUMMARY_FIELDS = (
+    'id', 'student_id', 'subject_id', 'title', 'difficulty_level', 'start_date',
+    'target_completion_date', 'is_active', 'completion_percentage',
+)
+LEARNING_PATH_FIELDS = LEARNING_PATH_SUMMARY_FIELDS + (
+    'description', 'personalized_goals', 'recommended_resources',
+)
+
+PROGRESS_FIELDS = (
+    'id', 'student_id', 'learning_path_id', 'content_id', 'status',
+    'completion_percentage', 'time_spent_minutes', 'mastery_level', 'score',
+    'started_at', 'completed_at',
+)
+
+ASSESSMENT_FIELDS = (
+    'id', 'subject_id', 'content_id', 'title', 'assessment_type', 'description',
+    'questions', 'total_points', 'passing_score', 'difficulty_level',
+    'time_limit_minutes',
+)
+
+STUDENT_FIELDS = (
+    'id', 'first_name', 'last_name', 'email', 'date_of_birth', 'gender',
+    'grade_level', 'is_active', 'enrollment_date', 'phone_number', 'address',
+)
+
+ASSESSMENT_RESULT_SUMMARY_FIELDS = (
+    'id', 'student_id', 'assessment_id', 'score', 'passed', 'started_at',
+    'submitted_at', 'time_taken_minutes',
+)
+
+SUBJECT_NAME = {'subject_name': F('subject__name')}
+STUDENT_NAME = {'student_name': F('student__full_name')}
+CONTENT_TITLE = {'content_title': F('content__title')}
+ASSESSMENT_TITLE = {'assessment_title': F('assessment__title')}
+
+
 # ============================================================================
 # AUTHENTICATION
 # ============================================================================
@@ -216,12 +316,16 @@ class LoginResponseSchema(Schema):
 @api.post("/auth/login", response=LoginResponseSchema, tags=["Auth"])
 def login(request, payload: LoginInputSchema):
     """Login user and return profile info."""
-    from django.contrib.auth import authenticate
-
-    # Authenticate with Django
-    user = authenticate(username=payload.email, password=payload.password)
-
-    if not user:
+    # Fetch the user and both profiles in one query, then check the password
+    # ourselves instead of going through authenticate()
+    user = User.objects.select_related('student_profile', 'educator_profile').filter(
+        username=payload.email
+    ).first()
+
+    if user is None:
+        # Hash anyway so unknown emails take as long as wrong passwords
+        User().set_password(payload.password)
+    if user is None or not user.check_password(payload.password) or not user.is_active:
         return api.create_response(
             request,
             {"detail": "Invalid credentials"},
@@ -230,17 +334,8 @@ def login(request, payload: LoginInputSchema):
 
     # Check user type and get profile
     if payload.user_type == 'student':
-        try:
-            profile = Student.objects.get(user=user)
-            return {
-                "user_id": user.id,
-                "email": user.email,
-                "first_name": profile.first_name,
-                "last_name": profile.last_name,
-                "user_type": "student",
-                "profile_id": profile.id,
-            }
-        except Student.DoesNotExist:
+        profile = getattr(user, 'student_profile', None)
+        if profile is None:
             return api.create_response(
                 request,
                 {"detail": "User is not a student"},
@@ -248,28 +343,29 @@ def login(request, payload: LoginInputSchema):
             )
 
     elif payload.user_type == 'educator':
-        try:
-            profile = Educator.objects.get(user=user)
-            return {
-                "user_id": user.id,
-                "email": user.email,
-                "first_name": profile.first_name,
-                "last_name": profile.last_name,
-                "user_type": "educator",
-                "profile_id": profile.id,
-            }
-        except Educator.DoesNotExist:
+        profile = getattr(user, 'educator_profile', None)
+        if profile is None:
             return api.create_response(
                 request,
                 {"detail": "User is not an educator"},
                 status=403
             )
 
-    return api.create_response(
-        request,
-        {"detail": "Invalid user type"},
-        status=400
-    )
+    else:
+        return api.create_response(
+            request,
+            {"detail": "Invalid user type"},
+            status=400
+        )
+
+    return {
+        "user_id": user.id,
+        "email": user.email,
+        "first_name": profile.first_name,
+        "last_name": profile.last_name,
+        "user_type": payload.user_type,
+        "profile_id": profile.id,
+    }
 
 
 # ============================================================================
@@ -292,27 +388,28 @@ def get_student(request, student_id: int):
 @api.post("/students", response=StudentOutputSchema, tags=["Students"])
 def create_student(request, payload: StudentInputSchema):
     """Create a new student."""
-    # Create user
-    user = User.objects.create_user(
-        username=payload.email,
-        email=payload.email,
-        password=payload.password,
-        first_name=payload.first_name,
-        last_name=payload.last_name,
-    )
+    with transaction.atomic():
+        # Create user
+        user = User.objects.create_user(
+            username=payload.email,
+            email=payload.email,
+            password=payload.password,
+            first_name=payload.first_name,
+            last_name=payload.last_name,
+        )
 
-    # Create student profile
-    student = Student.objects.create(
-        user=user,
-        first_name=payload.first_name,
-        last_name=payload.last_name,
-        email=payload.email,
-        date_of_birth=payload.date_of_birth,
-        gender=payload.gender,
-        grade_level=payload.grade_level,
-        phone_number=payload.phone_number,
-        address=payload.address,
-    )
+        # Create student profile
+        student = Student.objects.create(
+            user=user,
+            first_name=payload.first_name,
+            last_name=payload.last_name,
+            email=payload.email,
+            date_of_birth=payload.date_of_birth,
+            gender=payload.gender,
+            grade_level=payload.grade_level,
+            phone_number=payload.phone_number,
+            address=payload.address,
+        )
 
     return student
 
@@ -337,35 +434,27 @@ def get_subject(request, subject_id: int):
 # CONTENT
 # ============================================================================
 
-@api.get("/content", response=List[ContentOutputSchema], tags=["Content"])
+@api.get("/content", response=List[ContentListOutputSchema], tags=["Content"])
 @paginate
 def list_content(request, subject_id: Optional[int] = None, difficulty: Optional[str] = None):
     """List all content, optionally filtered by subject and difficulty."""
-    queryset = Content.objects.select_related('subject').all()
+    queryset = Content.objects.order_by('subject', 'difficulty_level', 'title', 'id')
 
     if subject_id:
-        queryset = queryset.filter(subject_id=subject_id)
+        # Within one subject the subject sort keys are constant, so order by the rest and
+        # let content_catalog_idx serve the filter and the sort
+        queryset = queryset.filter(subject_id=subject_id).order_by('difficulty_level', 'title', 'id')
     if difficulty:
         queryset = queryset.filter(difficulty_level=difficulty)
 
-    results = []
-    for content in queryset:
-        results.append({
-            **content.__dict__,
-            "subject_name": content.subject.name,
-        })
-
-    return results
+    # content_body is left out: the list view never renders it and it is the widest column
+    return queryset.values(*CONTENT_LIST_FIELDS, **SUBJECT_NAME)
 
 
 @api.get("/content/{content_id}", response=ContentOutputSchema, tags=["Content"])
 def get_content(request, content_id: int):
     """Get specific content."""
-    content = get_object_or_404(Content.objects.select_related('subject'), id=content_id)
-    return {
-        **content.__dict__,
-        "subject_name": content.subject.name,
-    }
+    return get_object_or_404(Content.objects.values(*CONTENT_FIELDS, **SUBJECT_NAME), id=content_id)
 
 
 # ============================================================================
@@ -373,93 +462,92 @@ def get_content(request, content_id: int):
 # ============================================================================
 
 @api.get("/learning-paths", response=List[LearningPathOutputSchema], tags=["Learning Paths"])
+@paginate
 def list_learning_paths(request, student_id: Optional[int] = None):
     """List all learning paths, optionally filtered by student."""
-    queryset = LearningPath.objects.select_related('student', 'subject').all()
+    queryset = LearningPath.objects.all()
 
     if student_id:
         queryset = queryset.filter(student_id=student_id)
 
-    paths = []
-    for path in queryset:
-        paths.append({
-            **path.__dict__,
-            "student_name": path.student.full_name,
-            "subject_name": path.subject.name,
-            "completion_percentage": path.completion_percentage,
-        })
-
-    return paths
+    # Tie-break on id so LIMIT/OFFSET pages are deterministic
+    return queryset.order_by('-created_at', '-id').values(
+        *LEARNING_PATH_FIELDS, **STUDENT_NAME, **SUBJECT_NAME
+    )
 
 
 @api.get("/learning-paths/{path_id}", response=LearningPathOutputSchema, tags=["Learning Paths"])
 def get_learning_path(request, path_id: int):
     """Get a specific learning path."""
-    path = get_object_or_404(LearningPath.objects.select_related('student', 'subject'), id=path_id)
-    return {
-        **path.__dict__,
-        "student_name": path.student.full_name,
-        "subject_name": path.subject.name,
-        "completion_percentage": path.completion_percentage,
-    }
+    return get_object_or_404(
+        LearningPath.objects.values(*LEARNING_PATH_FIELDS, **STUDENT_NAME, **SUBJECT_NAME), id=path_id
+    )
 
 
 @api.post("/learning-paths", response=LearningPathOutputSchema, tags=["Learning Paths"])
 def create_learning_path(request, payload: LearningPathInputSchema):
-    """Create a new learning path and assign content."""
+    """Create a new learning path and assign content.
+
+    The path starts with default goals; Grok's personalized goals replace them in the
+    background.
+    """
     student = get_object_or_404(Student, id=payload.student_id)
     subject = get_object_or_404(Subject, id=payload.subject_id)
 
-    # Generate personalized goals using Grok AI with error handling
-    try:
-        personalized_goals = grok_service.generate_personalized_goals(
-            student_grade=student.grade_level,
-            subject=subject.name,
-            difficulty=payload.difficulty_level
-        )
-    except Exception as e:
-        print(f"Error generating goals, using defaults: {e}")
-        personalized_goals = [
-            f"Master core concepts in {subject.name}",
-            "Complete assigned content with understanding",
-            f"Achieve proficiency at {payload.difficulty_level} level"
-        ]
+    # Resolve all requested content in one query before writing anything; in_bulk()
+    # keeps the catalog ordering, which would join subject just to sort a dict
+    contents = Content.objects.list_view().order_by().in_bulk(payload.content_ids)
+    if len(contents) != len(set(payload.content_ids)):
+        raise Http404("No Content matches the given query.")
+
+    # Start from default goals; a worker swaps in Grok's personalized ones after commit
+    personalized_goals = [
+        f"Master core concepts in {subject.name}",
+        "Complete assigned content with understanding",
+        f"Achieve proficiency at {payload.difficulty_level} level"
+    ]
 
     recommended_resources = [
         {"title": "Khan Academy", "url": "https://khanacademy.org", "type": "external"},
     ]
 
-    # Create learning path
-    learning_path = LearningPath.objects.create(
-        student=student,
-        subject=subject,
-        title=payload.title,
-        description=payload.description,
-        difficulty_level=payload.difficulty_level,
-        personalized_goals=personalized_goals,
-        recommended_resources=recommended_resources,
-        start_date=payload.start_date,
-        target_completion_date=payload.target_completion_date,
-    )
-
-    # Assign content in order
-    for order, content_id in enumerate(payload.content_ids, start=1):
-        content = get_object_or_404(Content, id=content_id)
-        ContentAssignment.objects.create(
-            learning_path=learning_path,
-            content=content,
-            order=order,
-            is_required=True,
-        )
-
-        # Create initial progress record
-        Progress.objects.create(
+    with transaction.atomic():
+        # Create learning path
+        learning_path = LearningPath.objects.create(
             student=student,
-            learning_path=learning_path,
-            content=content,
-            status='not_started',
+            subject=subject,
+            title=payload.title,
+            description=payload.description,
+            difficulty_level=payload.difficulty_level,
+            personalized_goals=personalized_goals,
+            recommended_resources=recommended_resources,
+            start_date=payload.start_date,
+            target_completion_date=payload.target_completion_date,
         )
 
+        # Assign content in order
+        ContentAssignment.objects.bulk_create([
+            ContentAssignment(
+                learning_path=learning_path,
+                content=contents[content_id],
+                order=order,
+                is_required=True,
+            )
+            for order, content_id in enumerate(payload.content_ids, start=1)
+        ])
+
+        # Create initial progress records
+        Progress.objects.bulk_create([
+            Progress(
+                student=student,
+                learning_path=learning_path,
+                content=contents[content_id],
+                status='not_started',
+            )
+            for content_id in payload.content_ids
+        ])
+        transaction.on_commit(lambda: generate_learning_path_goals.delay(learning_path.id))
+
     return {
         **learning_path.__dict__,
         "student_name": student.full_name,
@@ -473,55 +561,58 @@ def create_learning_path(request, payload: LearningPathInputSchema):
 # ============================================================================
 
 @api.get("/progress", response=List[ProgressOutputSchema], tags=["Progress"])
+@paginate
 def list_progress(request, student_id: Optional[int] = None, learning_path_id: Optional[int] = None):
     """List progress records, optionally filtered."""
-    queryset = Progress.objects.select_related('student', 'learning_path', 'content').all()
+    queryset = Progress.objects.all()
 
     if student_id:
         queryset = queryset.filter(student_id=student_id)
     if learning_path_id:
         queryset = queryset.filter(learning_path_id=learning_path_id)
 
-    results = []
-    for progress in queryset:
-        results.append({
-            **progress.__dict__,
-            "content_title": progress.content.title,
-        })
-
-    return results
+    return queryset.order_by('-updated_at', '-id').values(*PROGRESS_FIELDS, **CONTENT_TITLE)
 
 
 @api.put("/progress/{progress_id}", response=ProgressOutputSchema, tags=["Progress"])
 def update_progress(request, progress_id: int, payload: ProgressInputSchema):
     """Update progress record."""
-    progress = get_object_or_404(Progress, id=progress_id)
+    now = timezone.now()
+    changes = {}
 
     if payload.status:
-        progress.status = payload.status
-        if payload.status == 'in_progress' and not progress.started_at:
-            progress.started_at = datetime.now()
-        elif payload.status == 'completed' and not progress.completed_at:
-            progress.completed_at = datetime.now()
+        changes['status'] = payload.status
+        # Only stamp the transition the first time it happens
+        if payload.status == 'in_progress':
+            changes['started_at'] = Coalesce(F('started_at'), Value(now))
+        elif payload.status == 'completed':
+            changes['completed_at'] = Coalesce(F('completed_at'), Value(now))
 
     if payload.completion_percentage is not None:
-        progress.completion_percentage = payload.completion_percentage
+        changes['completion_percentage'] = payload.completion_percentage
 
     if payload.time_spent_minutes is not None:
-        progress.time_spent_minutes = payload.time_spent_minutes
+        changes['time_spent_minutes'] = payload.time_spent_minutes
 
     if payload.mastery_level is not None:
-        progress.mastery_level = payload.mastery_level
+        changes['mastery_level'] = payload.mastery_level
 
     if payload.score is not None:
-        progress.score = payload.score
+        changes['score'] = payload.score
 
-    progress.save()
+    # QuerySet.update() skips auto_now, so stamp updated_at explicitly
+    changes['updated_at'] = now
 
-    return {
-        **progress.__dict__,
-        "content_title": progress.content.title,
-    }
+    if not Progress.objects.filter(id=progress_id).update(**changes):
+        raise Http404("No Progress matches the given query.")
+
+    progress = Progress.objects.values(*PROGRESS_FIELDS, **CONTENT_TITLE).get(id=progress_id)
+
+    # Only a completion can change the path's completed count; no other status clears completed_at
+    if payload.status == 'completed':
+        LearningPath.refresh_completion_percentage(progress['learning_path_id'])
+
+    return progress
 
 
 # ============================================================================
@@ -529,105 +620,95 @@ def update_progress(request, progress_id: int, payload: ProgressInputSchema):
 # ============================================================================
 
 @api.get("/assessments", response=List[AssessmentOutputSchema], tags=["Assessments"])
+@paginate
 def list_assessments(request, subject_id: Optional[int] = None):
     """List all assessments."""
-    queryset = Assessment.objects.select_related('subject').all()
+    queryset = Assessment.objects.all()
 
     if subject_id:
         queryset = queryset.filter(subject_id=subject_id)
 
-    results = []
-    for assessment in queryset:
-        results.append({
-            **assessment.__dict__,
-            "subject_name": assessment.subject.name,
-        })
-
-    return results
+    return queryset.order_by('subject', 'difficulty_level', 'title', 'id').values(
+        *ASSESSMENT_FIELDS, **SUBJECT_NAME
+    )
 
 
 @api.get("/assessments/{assessment_id}", response=AssessmentOutputSchema, tags=["Assessments"])
 def get_assessment(request, assessment_id: int):
     """Get a specific assessment."""
-    assessment = get_object_or_404(Assessment.objects.select_related('subject'), id=assessment_id)
-    return {
-        **assessment.__dict__,
-        "subject_name": assessment.subject.name,
-    }
+    return get_object_or_404(Assessment.objects.values(*ASSESSMENT_FIELDS, **SUBJECT_NAME), id=assessment_id)
 
 
 @api.post("/assessments/{assessment_id}/submit", response=AssessmentResultOutputSchema, tags=["Assessments"])
 def submit_assessment(request, assessment_id: int, payload: AssessmentInputSchema):
-    """Submit an assessment and get results."""
-    assessment = get_object_or_404(Assessment, id=assessment_id)
+    """Submit an assessment and get results.
+
+    The result starts with score-based feedback; Grok's personalized feedback replaces
+    it in the background.
+    """
+    # Only what scoring and the response need
+    assessment = get_object_or_404(
+        Assessment.objects.only('id', 'title', 'questions', 'passing_score', 'content_id'),
+        id=assessment_id,
+    )
     student = get_object_or_404(Student, id=payload.student_id)
 
-    # Calculate score (simple implementation)
+    # Score answers and collect missed questions for feedback in a single pass
+    answers = {str(question_id): answer for question_id, answer in payload.answers.items()}
     total_questions = len(assessment.questions)
     correct_answers = 0
+    questions_missed = []
 
     for question in assessment.questions:
         question_id = str(question.get('id'))
-        if question_id in payload.answers:
-            if payload.answers[question_id] == question.get('correct_answer'):
-                correct_answers += 1
+        if question_id not in answers:
+            continue
+        if answers[question_id] == question.get('correct_answer'):
+            correct_answers += 1
+        else:
+            questions_missed.append(question.get('question', 'Unknown question'))
 
     score = (correct_answers / total_questions * 100) if total_questions > 0 else 0
     passed = score >= assessment.passing_score
 
-    # Calculate time taken
-    time_taken = int((payload.submitted_at - payload.started_at).total_seconds() / 60)
-
-    # Identify questions missed for personalized feedback
-    questions_missed = []
-    for question in assessment.questions:
-        question_id = str(question.get('id'))
-        if question_id in payload.answers:
-            if payload.answers[question_id] != question.get('correct_answer'):
-                questions_missed.append(question.get('question', 'Unknown question'))
-
-    # Generate personalized feedback using Grok AI
-    ai_feedback = grok_service.generate_assessment_feedback(
-        score=score,
-        subject=assessment.subject.name,
-        questions_missed=questions_missed if questions_missed else None
-    )
+    with transaction.atomic():
+        # Create assessment result
+        result = AssessmentResult.objects.create(
+            student=student,
+            assessment=assessment,
+            learning_path_id=payload.learning_path_id,
+            answers=payload.answers,
+            score=score,
+            passed=passed,
+            started_at=payload.started_at,
+            submitted_at=payload.submitted_at,
+            feedback="",
+            # Score-based feedback for now; a worker asks Grok for personalized feedback after commit
+            ai_feedback=grok_service._fallback_feedback(score),
+            graded=True,
+        )
+        transaction.on_commit(
+            lambda: generate_result_feedback.delay(result.id, questions_missed or None)
+        )
 
-    # Create assessment result
-    result = AssessmentResult.objects.create(
-        student=student,
-        assessment=assessment,
-        learning_path_id=payload.learning_path_id,
-        answers=payload.answers,
-        score=score,
-        passed=passed,
-        started_at=payload.started_at,
-        submitted_at=payload.submitted_at,
-        time_taken_minutes=time_taken,
-        feedback="",
-        ai_feedback=ai_feedback,
-        graded=True,
-    )
+        # Update progress if linked to learning path. A single UPDATE is atomic
+        # per row, so concurrent submissions can't interleave a read and a write
+        if payload.learning_path_id and assessment.content_id:
+            now = timezone.now()
+            updates = {'score': score, 'mastery_level': score, 'updated_at': now}
+            if passed:
+                updates.update(status='completed', completed_at=now, completion_percentage=100)
+            else:
+                updates['status'] = 'needs_review'
 
-    # Update progress if linked to learning path
-    if payload.learning_path_id and assessment.content:
-        try:
-            progress = Progress.objects.get(
+            updated = Progress.objects.filter(
                 student=student,
                 learning_path_id=payload.learning_path_id,
-                content=assessment.content,
-            )
-            progress.score = score
-            progress.mastery_level = score
-            if passed:
-                progress.status = 'completed'
-                progress.completed_at = datetime.now()
-                progress.completion_percentage = 100
-            else:
-                progress.status = 'needs_review'
-            progress.save()
-        except Progress.DoesNotExist:
-            pass
+                content_id=assessment.content_id,
+            ).update(**updates)
+            # A failed attempt leaves completed_at alone, so the path's completion can't change
+            if updated and passed:
+                LearningPath.refresh_completion_percentage(payload.learning_path_id)
 
     return {
         **result.__dict__,
@@ -639,11 +720,8 @@ def submit_assessment(request, assessment_id: int, payload: AssessmentInputSchem
 # AI MENTOR
 # ============================================================================
 
-@api.post("/ai-mentor/chat", response=AIMentorResponseOutputSchema, tags=["AI Mentor"])
-def chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
-    """Chat with the AI mentor (Grok) with full learning context."""
-    student = get_object_or_404(Student, id=payload.student_id)
-
+def _build_mentor_context(student, payload):
+    """Collect the student context and system prompt context for a mentor chat."""
     # Prepare rich context with student data
     context_data = {
         "student_grade": student.grade_level,
@@ -654,7 +732,9 @@ def chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
     system_context_parts = []
 
     if payload.learning_path_id:
-        learning_path = get_object_or_404(LearningPath, id=payload.learning_path_id)
+        learning_path = get_object_or_404(
+            LearningPath.objects.select_related('subject'), id=payload.learning_path_id
+        )
         context_data["subject"] = learning_path.subject.name
         context_data["difficulty"] = learning_path.difficulty_level
 
@@ -668,38 +748,42 @@ def chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
         progress_records = Progress.objects.filter(
             student=student,
             learning_path=learning_path
-        ).select_related('content')
+        )
 
-        if progress_records.exists():
-            # Calculate mastery statistics
-            completed_count = progress_records.filter(status='completed').count()
-            in_progress_count = progress_records.filter(status='in_progress').count()
-            avg_mastery = progress_records.aggregate(avg=django_models.Avg('mastery_level'))['avg'] or 0
+        # Calculate mastery statistics and the struggling (low mastery) and strong
+        # (high mastery) topics, most recently updated first, in a single aggregate query
+        stats = progress_records.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='completed')),
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            avg_mastery=Avg('mastery_level'),
+            struggling=ArrayAgg('content__title', filter=Q(mastery_level__lt=60), order_by='-updated_at'),
+            strong=ArrayAgg('content__title', filter=Q(mastery_level__gte=80), order_by='-updated_at'),
+        )
 
+        if stats['total']:
             system_context_parts.append(
-                f"Progress: {completed_count} items completed, {in_progress_count} in progress. "
-                f"Average mastery: {avg_mastery:.0f}%."
+                f"Progress: {stats['completed']} items completed, {stats['in_progress']} in progress. "
+                f"Average mastery: {stats['avg_mastery'] or 0:.0f}%."
             )
 
             # Identify struggling areas (low mastery)
-            struggling = progress_records.filter(mastery_level__lt=60).select_related('content')
-            if struggling.exists():
-                struggling_topics = [p.content.title for p in struggling[:3]]
+            struggling_topics = (stats['struggling'] or [])[:3]
+            if struggling_topics:
                 system_context_parts.append(
                     f"Areas needing support: {', '.join(struggling_topics)}."
                 )
 
             # Identify strengths (high mastery)
-            strengths = progress_records.filter(mastery_level__gte=80).select_related('content')
-            if strengths.exists():
-                strong_topics = [p.content.title for p in strengths[:3]]
+            strong_topics = (stats['strong'] or [])[:3]
+            if strong_topics:
                 system_context_parts.append(
                     f"Strong areas: {', '.join(strong_topics)}."
                 )
 
     # Add specific content context if student is viewing a particular content item
     if payload.content_id:
-        content = get_object_or_404(Content, id=payload.content_id)
+        content = get_object_or_404(Content.objects.list_view(), id=payload.content_id)
         context_data["current_content"] = content.title
         context_data["content_type"] = content.content_type
 
@@ -710,26 +794,111 @@ def chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
 
     system_context = " ".join(system_context_parts) if system_context_parts else None
 
-    # Get AI response from Grok with enhanced context
-    response_text = grok_service.chat(
-        user_message=payload.query,
-        system_context=system_context,
-        student_context=context_data
+    return context_data, system_context
+
+
+def _find_cached_mentor_session(student, query_hash):
+    """Find an earlier answer to the same question in the same context, if Grok gave one."""
+    return AIMentorSession.find_cached(
+        student, query_hash, exclude_responses=grok_service.FALLBACK_REPLIES.values()
     )
 
-    # Save session
+
+@api.post("/ai-mentor/chat", response={202: AIMentorResponseOutputSchema}, tags=["AI Mentor"])
+def chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
+    """Start a chat with the AI mentor (Grok) with full learning context.
+
+    The response is generated in the background; poll the returned session until
+    its status is no longer 'pending'.
+    """
+    student = get_object_or_404(Student, id=payload.student_id)
+    context_data, system_context = _build_mentor_context(student, payload)
+    query_hash = AIMentorSession.hash_query(payload.query, context_data, system_context)
+    cached = _find_cached_mentor_session(student, query_hash)
+
+    # Save the session now and let a worker fill in Grok's response, unless the
+    # student already asked this in the same context
     session = AIMentorSession.objects.create(
         student=student,
         learning_path_id=payload.learning_path_id,
         session_type=payload.session_type,
         query=payload.query,
-        response=response_text,
+        response=cached.response if cached else "",
+        status='completed' if cached else 'pending',
         context_data=context_data,
+        query_hash=query_hash,
     )
+    if not cached:
+        transaction.on_commit(lambda: generate_mentor_response.delay(session.id, system_context))
 
-    return {
-        **session.__dict__,
-    }
+    return 202, session
+
+
+@api.post("/ai-mentor/chat/stream", tags=["AI Mentor"])
+def stream_chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
+    """Chat with the AI mentor, streaming Grok's answer as plain text while it is generated.
+
+    The session id is sent in the X-Session-Id header; the session is saved once the
+    stream finishes, as failed if it was cut off or did not yield a real answer.
+    """
+    student = get_object_or_404(Student, id=payload.student_id)
+    context_data, system_context = _build_mentor_context(student, payload)
+    query_hash = AIMentorSession.hash_query(payload.query, context_data, system_context)
+    cached = _find_cached_mentor_session(student, query_hash)
+
+    session = AIMentorSession.objects.create(
+        student=student,
+        learning_path_id=payload.learning_path_id,
+        session_type=payload.session_type,
+        query=payload.query,
+        response=cached.response if cached else "",
+        status='completed' if cached else 'pending',
+        context_data=context_data,
+        query_hash=query_hash,
+    )
+
+    def stream():
+        if cached:
+            yield cached.response
+            return
+
+        parts = []
+        finished = False
+        try:
+            for part in grok_service.chat_stream(payload.query, system_context, context_data):
+                parts.append(part)
+                yield part
+            finished = True
+        finally:
+            # Runs on completion and when the client disconnects mid-stream. Only a whole
+            # answer counts as completed and can be reused; a cut-off stream, one ending in
+            # an error fallback, or a refusal is kept as failed
+            response_text = "".join(parts).strip()
+            answered = (
+                finished
+                and parts
+                and parts[-1] not in grok_service.FALLBACK_REPLIES.values()
+                and not grok_service.is_refusal(response_text)
+            )
+            AIMentorSession.objects.filter(id=session.id).update(
+                response=response_text, status='completed' if answered else 'failed'
+            )
+
+    response = StreamingHttpResponse(stream(), content_type='text/plain; charset=utf-8')
+    response['X-Session-Id'] = str(session.id)
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx-style proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api.get("/ai-mentor/sessions/{session_id}", response=AIMentorResponseOutputSchema, tags=["AI Mentor"])
+def get_ai_mentor_session(request, session_id: int):
+    """Get an AI mentor session, including its response once generated."""
+    return get_object_or_404(
+        AIMentorSession.objects.only('id', 'session_type', 'query', 'response', 'status', 'created_at'),
+        id=session_id,
+    )
 
 
 # ============================================================================
@@ -737,16 +906,18 @@ def chat_with_ai_mentor(request, payload: AIMentorChatInputSchema):
 # ============================================================================
 
 @api.get("/attendance", response=List[AttendanceOutputSchema], tags=["Attendance"])
+@paginate
 def list_attendance(request, student_id: Optional[int] = None, date_from: Optional[date] = None):
-    """List attendance records."""
+    """List attendance records, from the last 30 days unless date_from is given."""
     queryset = Attendance.objects.all()
 
     if student_id:
         queryset = queryset.filter(student_id=student_id)
-    if date_from:
-        queryset = queryset.filter(date__gte=date_from)
+    if date_from is None:
+        date_from = timezone.localdate() - timedelta(days=30)
+    queryset = queryset.filter(date__gte=date_from)
 
-    return queryset
+    return queryset.order_by('-date', '-id')
 
 
 # ============================================================================
@@ -756,55 +927,126 @@ def list_attendance(request, student_id: Optional[int] = None, date_from: Option
 @api.get("/dashboard/student/{student_id}", tags=["Dashboard"])
 def get_student_dashboard(request, student_id: int):
     """Get student dashboard data."""
-    student = get_object_or_404(Student, id=student_id)
-
-    # Get learning paths
-    learning_paths = LearningPath.objects.filter(student=student, is_active=True)
-
-    # Get recent progress
-    recent_progress = Progress.objects.filter(student=student).order_by('-updated_at')[:5]
+    # Fetch the mastery average and assessment count alongside the student row
+    average_mastery = Progress.objects.filter(
+        student=OuterRef('pk')
+    ).order_by().values('student').annotate(avg=Avg('mastery_level')).values('avg')
+    assessments_taken = AssessmentResult.objects.filter(
+        student=OuterRef('pk')
+    ).order_by().values('student').annotate(count=Count('pk')).values('count')
+
+    student = get_object_or_404(
+        Student.objects.values(
+            *STUDENT_FIELDS,
+            average_mastery=Coalesce(Subquery(average_mastery), 0, output_field=FloatField()),
+            assessments_taken=Coalesce(Subquery(assessments_taken), 0),
+        ),
+        id=student_id,
+    )
+    # The aggregates ride along on the student row; split them out of the student payload
+    student_mastery = student.pop('average_mastery')
+    student_assessments = student.pop('assessments_taken')
+
+    # Get learning paths, newest first, materialized so the stats below don't re-query
+    learning_paths = list(
+        LearningPath.objects.filter(student_id=student_id, is_active=True).order_by('-created_at', '-id').values(
+            *LEARNING_PATH_SUMMARY_FIELDS, **STUDENT_NAME, **SUBJECT_NAME
+        )
+    )
 
-    # Get recent assessment results
-    recent_results = AssessmentResult.objects.filter(student=student).order_by('-created_at')[:5]
+    # Get recent progress and assessment results; the slices are evaluated once here
+    recent_progress = list(
+        Progress.objects.filter(student_id=student_id).order_by('-updated_at').values(
+            *PROGRESS_FIELDS, **CONTENT_TITLE
+        )[:5]
+    )
+    recent_results = list(
+        AssessmentResult.objects.filter(student_id=student_id).order_by('-created_at').values(
+            *ASSESSMENT_RESULT_SUMMARY_FIELDS, **ASSESSMENT_TITLE
+        )[:5]
+    )
 
     # Calculate overall stats
-    total_paths = learning_paths.count()
-    avg_completion = sum(path.completion_percentage for path in learning_paths) / total_paths if total_paths > 0 else 0
-    avg_mastery = Progress.objects.filter(student=student).aggregate(avg=models.Avg('mastery_level'))['avg'] or 0
+    total_paths = len(learning_paths)
+    avg_completion = fmean(path['completion_percentage'] for path in learning_paths) if learning_paths else 0
 
     return {
-        "student": StudentOutputSchema.from_orm(student),
-        "learning_paths": [LearningPathOutputSchema.from_orm(path) for path in learning_paths],
-        "recent_progress": [ProgressOutputSchema.from_orm(p) for p in recent_progress],
-        "recent_results": [AssessmentResultOutputSchema.from_orm(r) for r in recent_results],
+        "student": student,
+        "learning_paths": learning_paths,
+        "recent_progress": recent_progress,
+        "recent_results": recent_results,
         "stats": {
             "total_learning_paths": total_paths,
             "average_completion": round(avg_completion, 2),
-            "average_mastery": round(avg_mastery, 2),
-            "total_assessments_taken": recent_results.count(),
+            "average_mastery": round(student_mastery, 2),
+            "total_assessments_taken": student_assessments,
         }
     }
 
 
+def _educator_dashboard_etag(subject_id, limit, offset):
+    """Weak ETag from the newest write to each table the dashboard reads.
+
+    Each Max() is a single descent of an updated_at/created_at index. Renames of the
+    students, subjects, content and assessments it shows, and deletes, which leave
+    the newest timestamps as they were, bump dashboard_version() instead.
+    """
+    parts = [subject_id, limit, offset, dashboard_version()]
+    parts.extend(LearningPath.objects.aggregate(changed=Max('updated_at')).values())
+    parts.extend(Progress.objects.aggregate(changed=Max('updated_at')).values())
+    # Results are append-only, so created_at is their last write
+    parts.extend(AssessmentResult.objects.aggregate(changed=Max('created_at')).values())
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
 @api.get("/dashboard/educator", tags=["Dashboard"])
-def get_educator_dashboard(request, subject_id: Optional[int] = None):
-    """Get educator dashboard data."""
-    # Get all learning paths, optionally filtered by subject
-    queryset = LearningPath.objects.select_related('student', 'subject').all()
+def get_educator_dashboard(request, response: HttpResponse, subject_id: Optional[int] = None, limit: int = 50, offset: int = 0):
+    """Get educator dashboard data, with learning paths paged by limit/offset.
+
+    Sends an ETag and answers 304 Not Modified when If-None-Match still matches.
+    """
+    # Get a page of learning paths, optionally filtered by subject
+    queryset = LearningPath.objects.all()
 
     if subject_id:
         queryset = queryset.filter(subject_id=subject_id)
 
-    # Get students needing attention
+    limit = min(max(limit, 1), 100)
+    offset = max(offset, 0)
+
+    etag = _educator_dashboard_etag(subject_id, limit, offset)
+    # Weak comparison, so ignore any W/ prefix on either side
+    client_etags = parse_etags(request.headers.get('If-None-Match', ''))
+    if '*' in client_etags or etag.removeprefix('W/') in [tag.removeprefix('W/') for tag in client_etags]:
+        not_modified = HttpResponseNotModified()
+        not_modified['ETag'] = etag
+        return not_modified
+    response['ETag'] = etag
+
+    learning_paths_count = queryset.count()
+    learning_paths = queryset.order_by('-created_at', '-id').values(
+        *LEARNING_PATH_SUMMARY_FIELDS, **STUDENT_NAME, **SUBJECT_NAME
+    )[offset:offset + limit]
+
+    # Get students needing attention, one row per student with their flagged content
     students_needing_attention = Progress.objects.filter(
         status='needs_review'
-    ).select_related('student').distinct()
+    ).values(
+        'student_id', 'student__first_name', 'student__last_name'
+    ).annotate(
+        flagged=Count('id'),
+        content_titles=ArrayAgg('content__title', order_by='content__title'),
+    ).order_by('student_id')
 
     # Get recent assessment results
-    recent_results = AssessmentResult.objects.select_related('student', 'assessment').order_by('-created_at')[:10]
+    recent_results = AssessmentResult.objects.order_by('-created_at').values(
+        *ASSESSMENT_RESULT_SUMMARY_FIELDS, **ASSESSMENT_TITLE
+    )[:10]
 
     return {
-        "learning_paths": [LearningPathOutputSchema.from_orm(path) for path in queryset],
-        "students_needing_attention": list(students_needing_attention.values('student_id', 'student__first_name', 'student__last_name', 'content__title')),
-        "recent_results": [AssessmentResultOutputSchema.from_orm(r) for r in recent_results],
+        "learning_paths": list(learning_paths),
+        "learning_paths_count": learning_paths_count,
+        "students_needing_attention": list(students_needing_attention),
+        "recent_results": list(recent_results),
     }
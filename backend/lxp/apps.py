@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class LxpConfig(AppConfig):
     name = 'lxp'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,20 +1,75 @@
 """
 Grok AI Service - Integration with xAI's Grok API
 """
+import asyncio
+import hashlib
 import os
-from openai import OpenAI
+import re
+from typing import ClassVar
+
+import httpx
+from django.core.cache import cache
+from openai import APITimeoutError, AsyncOpenAI, AuthenticationError, OpenAI, RateLimitError
+
+
+# Generated goals/feedback only depend on their inputs, so reuse them for a day
+GROK_CACHE_TIMEOUT = 60 * 60 * 24
+# Goals come from a small (grade, subject, difficulty) space and rarely need refreshing
+GROK_GOALS_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+# Most concurrent Grok requests a feedback batch keeps in flight
+GROK_BATCH_CONCURRENCY = 16
+
+# Phrases that mean Grok declined to answer, matched in one pass over the raw response
+_REFUSAL_RE = re.compile(r"i cannot|i[’']m unable to|against my programming", re.IGNORECASE)
+
+# A bulleted goal line (-, *, • or "1.") with more than 10 characters of text
+_GOAL_BULLET_RE = re.compile(r"^[ \t]*(?:[-*•]+|\d+\.)[ \t]*(.{11,}?)\s*$", re.MULTILINE)
+
+
+def _cache_key(prefix: str, *parts) -> str:
+    """Build a short, backend-safe cache key from arbitrary input values."""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'grok:{prefix}:{digest}'
 
 
 class GrokService:
     """Service for interacting with Grok AI via xAI API."""
 
+    # Mentor preamble shared by every chat; per-student context is appended after it
+    _BASE_SYSTEM: ClassVar[str] = (
+        "You are an AI Learning Mentor helping students with their studies. "
+        "You should be encouraging, patient, and provide clear explanations tailored to the student's level. "
+        "Keep responses concise (2-3 paragraphs) and actionable. "
+    )
+
+    # Canned mentor replies sent in place of a Grok answer, keyed by what went wrong
+    FALLBACK_REPLIES: ClassVar[dict[str, str]] = {
+        'empty': "I didn't receive a question. What would you like to know?",
+        'refusal': "I'd be happy to help with your studies! Could you rephrase your question or ask about a specific topic you're learning?",
+        'timeout': "I'm taking a bit longer to think. Could you try asking your question again?",
+        'auth': "I'm having trouble connecting to my knowledge base. Please let your teacher know.",
+        'rate_limit': "I'm getting too many questions right now. Please wait a moment and try again.",
+        'error': "I encountered an issue, but I'm here to help! Could you try rephrasing your question?",
+    }
+
     def __init__(self):
         api_key = os.getenv('XAI_API_KEY', 'your_xai_api_key_here')
+        self._api_key = api_key
+        self._base_url = "https://api.x.ai/v1"
+
+        # One pooled HTTP/2 client so calls reuse warm TLS connections to xAI
+        self._http = httpx.Client(
+            http2=True,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
 
         # xAI API is compatible with OpenAI's format
         self.client = OpenAI(
             api_key=api_key,
-            base_url="https://api.x.ai/v1"
+            base_url=self._base_url,
+            http_client=self._http,
         )
         self.model = "grok-4-latest"  # Use latest Grok model
 
@@ -32,34 +87,13 @@ class GrokService:
         """
         # Validate input
         if not user_message or not user_message.strip():
-            return "I didn't receive a question. What would you like to know?"
-
-        # Build system message with context
-        system_message = "You are an AI Learning Mentor helping students with their studies. "
-        system_message += "You should be encouraging, patient, and provide clear explanations tailored to the student's level. "
-        system_message += "Keep responses concise (2-3 paragraphs) and actionable. "
-
-        if student_context:
-            if 'student_name' in student_context:
-                system_message += f"Address the student as {student_context['student_name']}. "
-            if 'student_grade' in student_context:
-                system_message += f"The student is in grade {student_context['student_grade']}. "
-            if 'subject' in student_context:
-                system_message += f"They are currently studying {student_context['subject']}. "
-            if 'difficulty' in student_context:
-                system_message += f"The difficulty level is {student_context['difficulty']}. "
-
-        if system_context:
-            system_message += f"\n\nCurrent learning context: {system_context}"
+            return self.FALLBACK_REPLIES['empty']
 
         try:
             # Call Grok API
             completion = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
+                messages=self._chat_messages(user_message, system_context, student_context),
                 temperature=0.7,
                 max_tokens=500,
                 timeout=15.0,  # 15 second timeout
@@ -75,27 +109,87 @@ class GrokService:
                 raise ValueError("Empty response content from API")
 
             # Check for inappropriate or error responses
-            response_lower = response_content.lower()
-            if any(phrase in response_lower for phrase in ['i cannot', 'i\'m unable to', 'against my programming']):
+            if self.is_refusal(response_content):
                 print(f"Grok refused to answer: {response_content}")
-                return "I'd be happy to help with your studies! Could you rephrase your question or ask about a specific topic you're learning?"
+                return self.FALLBACK_REPLIES['refusal']
 
             return response_content.strip()
 
         except Exception as e:
-            # Log the specific error
-            error_type = type(e).__name__
-            print(f"Grok API Error ({error_type}): {str(e)}")
-
-            # Provide context-specific fallback responses
-            if 'timeout' in str(e).lower():
-                return "I'm taking a bit longer to think. Could you try asking your question again?"
-            elif 'api_key' in str(e).lower() or 'authentication' in str(e).lower():
-                return "I'm having trouble connecting to my knowledge base. Please let your teacher know."
-            elif 'rate_limit' in str(e).lower():
-                return "I'm getting too many questions right now. Please wait a moment and try again."
-            else:
-                return f"I encountered an issue, but I'm here to help! Could you try rephrasing your question?"
+            return self._chat_fallback(e)
+
+    def chat_stream(self, user_message: str, system_context: str = None, student_context: dict = None):
+        """
+        Stream Grok's chat response as it is generated.
+
+        Takes the same arguments as chat() and yields text fragments. Errors yield
+        the same fallback messages as chat(), after any text already streamed. The
+        refusal check is left to the caller, since the text has already been sent by
+        the time a refusal could be spotted; see is_refusal().
+        """
+        if not user_message or not user_message.strip():
+            yield self.FALLBACK_REPLIES['empty']
+            return
+
+        try:
+            completion = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._chat_messages(user_message, system_context, student_context),
+                temperature=0.7,
+                max_tokens=500,
+                timeout=15.0,
+                stream=True,
+            )
+
+            for chunk in completion:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            yield self._chat_fallback(e)
+
+    @staticmethod
+    def is_refusal(text: str) -> bool:
+        """Whether a chat response reads as Grok declining to answer."""
+        return bool(_REFUSAL_RE.search(text))
+
+    def _chat_messages(self, user_message: str, system_context: str = None, student_context: dict = None) -> list:
+        """Build the system and user messages for a mentor chat."""
+        parts = [self._BASE_SYSTEM]
+
+        if student_context:
+            if 'student_name' in student_context:
+                parts.append(f"Address the student as {student_context['student_name']}. ")
+            if 'student_grade' in student_context:
+                parts.append(f"The student is in grade {student_context['student_grade']}. ")
+            if 'subject' in student_context:
+                parts.append(f"They are currently studying {student_context['subject']}. ")
+            if 'difficulty' in student_context:
+                parts.append(f"The difficulty level is {student_context['difficulty']}. ")
+
+        if system_context:
+            parts.append(f"\n\nCurrent learning context: {system_context}")
+
+        return [
+            {"role": "system", "content": "".join(parts)},
+            {"role": "user", "content": user_message}
+        ]
+
+    def _chat_fallback(self, e: Exception) -> str:
+        """Log a failed chat call and pick a student-friendly fallback message."""
+        # Log the specific error
+        error_type = type(e).__name__
+        print(f"Grok API Error ({error_type}): {str(e)}")
+
+        # Provide context-specific fallback responses based on the openai error type
+        if isinstance(e, APITimeoutError):
+            return self.FALLBACK_REPLIES['timeout']
+        elif isinstance(e, AuthenticationError):
+            return self.FALLBACK_REPLIES['auth']
+        elif isinstance(e, RateLimitError):
+            return self.FALLBACK_REPLIES['rate_limit']
+        else:
+            return self.FALLBACK_REPLIES['error']
 
     def generate_personalized_goals(self, student_grade: int, subject: str, difficulty: str) -> list:
         """
@@ -113,6 +207,11 @@ class GrokService:
         if not subject or not isinstance(student_grade, int) or student_grade < 1:
             return self._get_fallback_goals(subject, difficulty)
 
+        cache_key = _cache_key('goals', student_grade, subject, difficulty)
+        cached_goals = cache.get(cache_key)
+        if cached_goals is not None:
+            return cached_goals
+
         prompt = f"""Generate exactly 4 specific, measurable, and achievable learning goals for a grade {student_grade} student
 studying {subject} at a {difficulty} level. Each goal should be:
 - One clear sentence
@@ -143,22 +242,14 @@ Format: Return ONLY a bulleted list with exactly 4 goals, each starting with a d
             if not response or not response.strip():
                 raise ValueError("Empty response from API")
 
-            # Parse bullet points into list with validation
-            lines = response.split('\n')
-            goals = []
-
-            for line in lines:
-                line = line.strip()
-                # Handle various bullet formats: -, *, •, 1., etc.
-                if line and (line.startswith('-') or line.startswith('*') or line.startswith('•') or (line[0].isdigit() and '.' in line[:3])):
-                    # Clean up the goal text
-                    goal = line.lstrip('-*•0123456789. ').strip()
-                    if goal and len(goal) > 10:  # Ensure meaningful content
-                        goals.append(goal)
+            # Parse bullet points (-, *, •, 1., etc.) with meaningful content into a list
+            goals = _GOAL_BULLET_RE.findall(response)
 
             # Validate we got enough goals
             if len(goals) >= 3:
-                return goals[:5]  # Return max 5 goals
+                goals = goals[:5]  # Return max 5 goals
+                cache.set(cache_key, goals, GROK_GOALS_CACHE_TIMEOUT)
+                return goals
             else:
                 print(f"Grok returned insufficient goals ({len(goals)}): {goals}")
                 return self._get_fallback_goals(subject, difficulty)
@@ -180,32 +271,101 @@ Format: Return ONLY a bulleted list with exactly 4 goals, each starting with a d
 
     def generate_assessment_feedback(self, score: float, subject: str, questions_missed: list = None) -> str:
         """Generate personalized feedback for an assessment."""
-        prompt = f"""A student scored {score}% on a {subject} assessment. """
-        if questions_missed:
-            prompt += f"They struggled with: {', '.join(questions_missed)}. "
-        prompt += "Provide encouraging, specific feedback (2-3 sentences) on how to improve."
+        cache_key = self._feedback_cache_key(score, subject, questions_missed)
+        cached_feedback = cache.get(cache_key)
+        if cached_feedback is not None:
+            return self._with_score(score, cached_feedback)
 
         try:
             completion = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": self._feedback_prompt(score, subject, questions_missed)}
                 ],
                 temperature=0.7,
                 max_tokens=200,
             )
 
-            return completion.choices[0].message.content
+            feedback = completion.choices[0].message.content
+            cache.set(cache_key, feedback, GROK_CACHE_TIMEOUT)
+            return self._with_score(score, feedback)
         except Exception as e:
             print(f"Grok API Error: {e}")
-            # Fallback feedback
-            if score >= 80:
-                return f"Great job! You scored {score}% which shows strong understanding. Keep up the excellent work!"
-            elif score >= 60:
-                return f"You scored {score}%. You're on the right track! Review the areas you found challenging and try some practice problems."
-            else:
-                return f"You scored {score}%. Don't worry - learning takes time! Let's focus on understanding the fundamentals. I'm here to help if you have questions."
+            return self._fallback_feedback(score)
 
+    async def generate_assessment_feedback_batch(self, items: list) -> list:
+        """
+        Generate feedback for many assessments concurrently.
+
+        Args:
+            items: (score, subject, questions_missed) tuples
+
+        Returns:
+            Feedback strings in the same order as items
+        """
+        semaphore = asyncio.Semaphore(GROK_BATCH_CONCURRENCY)
+
+        # httpx async pools are bound to the running event loop, so each batch gets its own
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=GROK_BATCH_CONCURRENCY, max_connections=GROK_BATCH_CONCURRENCY),
+        ) as http_client:
+            aclient = AsyncOpenAI(api_key=self._api_key, base_url=self._base_url, http_client=http_client)
+
+            async def one(score, subject, questions_missed=None):
+                cache_key = self._feedback_cache_key(score, subject, questions_missed)
+                cached_feedback = await cache.aget(cache_key)
+                if cached_feedback is not None:
+                    return self._with_score(score, cached_feedback)
+
+                try:
+                    async with semaphore:
+                        completion = await aclient.chat.completions.create(
+                            model=self.model,
+                            messages=[
+                                {"role": "user", "content": self._feedback_prompt(score, subject, questions_missed)}
+                            ],
+                            temperature=0.7,
+                            max_tokens=200,
+                        )
+
+                    feedback = completion.choices[0].message.content
+                    await cache.aset(cache_key, feedback, GROK_CACHE_TIMEOUT)
+                    return self._with_score(score, feedback)
+                except Exception as e:
+                    print(f"Grok API Error: {e}")
+                    return self._fallback_feedback(score)
+
+            return await asyncio.gather(*(one(*item) for item in items))
+
+    @staticmethod
+    def _score_bucket(score: float) -> int:
+        # Nearby scores get the same advice, so feedback is cached per 10 points
+        return int(round(score, -1))
+
+    def _feedback_cache_key(self, score: float, subject: str, questions_missed: list = None) -> str:
+        return _cache_key('feedback', self._score_bucket(score), subject, sorted(questions_missed or []))
+
+    def _feedback_prompt(self, score: float, subject: str, questions_missed: list = None) -> str:
+        # Only the bucket goes into the prompt; the exact score is added outside the cached advice
+        prompt = f"""A student scored about {self._score_bucket(score)}% on a {subject} assessment. """
+        if questions_missed:
+            prompt += f"They struggled with: {', '.join(questions_missed)}. "
+        prompt += "Provide encouraging, specific feedback (2-3 sentences) on how to improve, without restating the score."
+        return prompt
+
+    def _with_score(self, score: float, feedback: str) -> str:
+        return f"You scored {round(score, 1):g}%. {feedback}"
+
+    def _fallback_feedback(self, score: float) -> str:
+        """Generate fallback feedback when AI is unavailable."""
+        if score >= 80:
+            return f"Great job! You scored {score}% which shows strong understanding. Keep up the excellent work!"
+        elif score >= 60:
+            return f"You scored {score}%. You're on the right track! Review the areas you found challenging and try some practice problems."
+        else:
+            return f"You scored {score}%. Don't worry - learning takes time! Let's focus on understanding the fundamentals. I'm here to help if you have questions."
 
 # Singleton instance
 grok_service = GrokService()
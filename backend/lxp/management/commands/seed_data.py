@@ -1,5 +1,9 @@
+import json
+from pathlib import Path
+
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import transaction
 from datetime import date, timedelta
 from lxp.models import (
     Student,
@@ -10,159 +14,58 @@ from lxp.models import (
 )
 
 
+SEED_CATALOG_PATH = Path(__file__).with_name('seed_data.json')
+
+
 class Command(BaseCommand):
     help = 'Seed the database with initial data'
 
+    # Seed everything in one transaction: a single commit, and nothing half-seeded on failure
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write('Seeding database...')
 
-        # Create subjects
-        subjects_data = [
-            {'name': 'Mathematics - Algebra', 'code': 'MATH-ALG-9', 'description': 'Fundamental algebra concepts for 9th grade', 'grade_level': 9},
-            {'name': 'Science - Biology', 'code': 'SCI-BIO-9', 'description': 'Introduction to biology and life sciences', 'grade_level': 9},
-            {'name': 'English Literature', 'code': 'ENG-LIT-9', 'description': 'Literary analysis and writing skills', 'grade_level': 9},
-        ]
-
-        subjects = {}
-        for subject_data in subjects_data:
-            subject, created = Subject.objects.get_or_create(
-                code=subject_data['code'],
-                defaults=subject_data
-            )
-            subjects[subject.code] = subject
-            self.stdout.write(f'  {"Created" if created else "Found"} subject: {subject.name}')
-
-        # Create content for Math
-        math_content_data = [
-            {
-                'title': 'Introduction to Variables',
-                'content_type': 'lesson',
-                'description': 'Learn what variables are and how to use them in algebra',
-                'content_body': 'A variable is a symbol (usually a letter) that represents an unknown value...',
-                'difficulty_level': 'beginner',
-                'estimated_duration_minutes': 30,
-            },
-            {
-                'title': 'Solving Linear Equations',
-                'content_type': 'video',
-                'description': 'Step-by-step guide to solving linear equations',
-                'content_body': 'Video content: How to isolate variables and solve for x...',
-                'difficulty_level': 'beginner',
-                'estimated_duration_minutes': 45,
-            },
-            {
-                'title': 'Practice: Linear Equations',
-                'content_type': 'exercise',
-                'description': 'Practice problems for linear equations',
-                'content_body': 'Solve the following equations: 1) 2x + 5 = 13, 2) 3x - 7 = 8...',
-                'difficulty_level': 'beginner',
-                'estimated_duration_minutes': 20,
-            },
-            {
-                'title': 'Graphing Linear Functions',
-                'content_type': 'lesson',
-                'description': 'Understanding how to graph lines on a coordinate plane',
-                'content_body': 'A linear function can be graphed using slope-intercept form y = mx + b...',
-                'difficulty_level': 'intermediate',
-                'estimated_duration_minutes': 40,
-            },
-            {
-                'title': 'Quadratic Equations Introduction',
-                'content_type': 'lesson',
-                'description': 'Introduction to quadratic equations and their properties',
-                'content_body': 'Quadratic equations are in the form ax² + bx + c = 0...',
-                'difficulty_level': 'advanced',
-                'estimated_duration_minutes': 50,
-            },
-        ]
-
-        for content_data in math_content_data:
-            Content.objects.get_or_create(
-                subject=subjects['MATH-ALG-9'],
-                title=content_data['title'],
-                defaults=content_data
-            )
-            self.stdout.write(f'  Created content: {content_data["title"]}')
-
-        # Create content for Biology
-        bio_content_data = [
-            {
-                'title': 'Introduction to Cells',
-                'content_type': 'lesson',
-                'description': 'Basic cell structure and function',
-                'content_body': 'Cells are the basic unit of life. They contain organelles...',
-                'difficulty_level': 'beginner',
-                'estimated_duration_minutes': 35,
-            },
-            {
-                'title': 'Photosynthesis Explained',
-                'content_type': 'video',
-                'description': 'How plants convert light energy into chemical energy',
-                'content_body': 'Video: The process of photosynthesis involves chloroplasts...',
-                'difficulty_level': 'beginner',
-                'estimated_duration_minutes': 30,
-            },
-            {
-                'title': 'DNA and Genetics',
-                'content_type': 'lesson',
-                'description': 'Understanding genetic information and inheritance',
-                'content_body': 'DNA is the hereditary material in organisms...',
-                'difficulty_level': 'intermediate',
-                'estimated_duration_minutes': 45,
-            },
-        ]
-
-        for content_data in bio_content_data:
-            Content.objects.get_or_create(
-                subject=subjects['SCI-BIO-9'],
-                title=content_data['title'],
-                defaults=content_data
-            )
-            self.stdout.write(f'  Created content: {content_data["title"]}')
+        # Subjects, content and badges are static catalog data kept alongside this command
+        with open(SEED_CATALOG_PATH, encoding='utf-8') as f:
+            catalog = json.load(f)
+        subjects_data = catalog['subjects']
+        badges_data = catalog['badges']
 
-        # Create content for English
-        eng_content_data = [
-            {
-                'title': 'Essay Writing Basics',
-                'content_type': 'lesson',
-                'description': 'How to structure and write effective essays',
-                'content_body': 'An essay consists of an introduction, body paragraphs, and conclusion...',
-                'difficulty_level': 'beginner',
-                'estimated_duration_minutes': 40,
-            },
-            {
-                'title': 'Poetry Analysis',
-                'content_type': 'reading',
-                'description': 'Techniques for analyzing poetry',
-                'content_body': 'When analyzing poetry, consider literary devices, theme, tone...',
-                'difficulty_level': 'intermediate',
-                'estimated_duration_minutes': 35,
-            },
+        # Create subjects
+        subject_codes = [d['code'] for d in subjects_data]
+        existing_codes = set(Subject.objects.filter(code__in=subject_codes).values_list('code', flat=True))
+        Subject.objects.bulk_create(
+            [Subject(**d) for d in subjects_data if d['code'] not in existing_codes],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        # Re-fetch so every subject has a primary key for the content rows below
+        subjects = {s.code: s for s in Subject.objects.filter(code__in=subject_codes)}
+        self.stdout.write(f'  Subjects: {len(subjects_data) - len(existing_codes)} created, {len(existing_codes)} found')
+
+        # Content has no unique key, so skip (subject, title) pairs that already exist
+        content_by_subject = catalog['content']
+        existing_content = set(
+            Content.objects.filter(subject__in=subjects.values()).values_list('subject__code', 'title')
+        )
+        new_content = [
+            Content(subject=subjects[code], **content_data)
+            for code, content_list in content_by_subject.items()
+            for content_data in content_list
+            if (code, content_data['title']) not in existing_content
         ]
-
-        for content_data in eng_content_data:
-            Content.objects.get_or_create(
-                subject=subjects['ENG-LIT-9'],
-                title=content_data['title'],
-                defaults=content_data
-            )
-            self.stdout.write(f'  Created content: {content_data["title"]}')
+        Content.objects.bulk_create(new_content, batch_size=500)
+        self.stdout.write(f'  Content: {len(new_content)} created')
 
         # Create badges
-        badges_data = [
-            {'name': 'First Steps', 'description': 'Completed your first lesson', 'icon': '🎯', 'criteria': 'Complete 1 content item', 'points': 10},
-            {'name': 'Knowledge Seeker', 'description': 'Completed 5 lessons', 'icon': '📚', 'criteria': 'Complete 5 content items', 'points': 25},
-            {'name': 'High Achiever', 'description': 'Achieved 90%+ on an assessment', 'icon': '⭐', 'criteria': 'Score 90% or higher on any assessment', 'points': 50},
-            {'name': 'Persistent Learner', 'description': 'Logged in 5 days in a row', 'icon': '🔥', 'criteria': 'Login streak of 5 days', 'points': 30},
-            {'name': 'Master of Mastery', 'description': 'Achieved 100% mastery in a subject', 'icon': '🏆', 'criteria': 'Reach 100% mastery in any subject', 'points': 100},
-        ]
-
-        for badge_data in badges_data:
-            badge, created = Badge.objects.get_or_create(
-                name=badge_data['name'],
-                defaults=badge_data
-            )
-            self.stdout.write(f'  {"Created" if created else "Found"} badge: {badge.name}')
+        existing_badges = set(
+            Badge.objects.filter(name__in=[d['name'] for d in badges_data]).values_list('name', flat=True)
+        )
+        Badge.objects.bulk_create(
+            [Badge(**d) for d in badges_data if d['name'] not in existing_badges],
+            batch_size=500,
+        )
+        self.stdout.write(f'  Badges: {len(badges_data) - len(existing_badges)} created, {len(existing_badges)} found')
 
         # Create test students
         students_data = [
@@ -195,19 +98,28 @@ class Command(BaseCommand):
             },
         ]
 
-        for student_data in students_data:
-            if not Student.objects.filter(email=student_data['email']).exists():
-                # Create user
-                user = User.objects.create_user(
-                    username=student_data['email'],
-                    email=student_data['email'],
-                    password=student_data['password'],
-                    first_name=student_data['first_name'],
-                    last_name=student_data['last_name'],
-                )
-                # Create student
-                student = Student.objects.create(
-                    user=user,
+        student_emails = [d['email'] for d in students_data]
+        existing_students = set(Student.objects.filter(email__in=student_emails).values_list('email', flat=True))
+        new_students_data = [d for d in students_data if d['email'] not in existing_students]
+
+        # Create users first, then map them back by email for the student rows
+        new_users = []
+        for student_data in new_students_data:
+            user = User(
+                username=student_data['email'],
+                email=student_data['email'],
+                first_name=student_data['first_name'],
+                last_name=student_data['last_name'],
+            )
+            user.set_password(student_data['password'])
+            new_users.append(user)
+        User.objects.bulk_create(new_users, ignore_conflicts=True, batch_size=500)
+        users = {u.username: u for u in User.objects.filter(username__in=[d['email'] for d in new_students_data])}
+
+        Student.objects.bulk_create(
+            [
+                Student(
+                    user=users[student_data['email']],
                     first_name=student_data['first_name'],
                     last_name=student_data['last_name'],
                     email=student_data['email'],
@@ -215,9 +127,11 @@ class Command(BaseCommand):
                     gender=student_data['gender'],
                     grade_level=student_data['grade_level'],
                 )
-                self.stdout.write(f'  Created student: {student.full_name}')
-            else:
-                self.stdout.write(f'  Student already exists: {student_data["first_name"]} {student_data["last_name"]}')
+                for student_data in new_students_data
+            ],
+            batch_size=500,
+        )
+        self.stdout.write(f'  Students: {len(new_students_data)} created, {len(existing_students)} found')
 
         # Create test educator
         if not Educator.objects.filter(email='mr.smith@teacher.lxp.com').exists():
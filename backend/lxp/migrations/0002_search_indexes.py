@@ -0,0 +1,107 @@
+# Generated by Django 6.0.2 on 2026-10-14 05:48
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Keep each search_vector in sync with its source columns on INSERT/UPDATE
+SEARCH_VECTOR_TRIGGERS = [
+    ('lxp_content', 'title', 'description'),
+    ('lxp_assessment', 'title', 'description'),
+    ('lxp_aimentorsession', 'query', 'response'),
+]
+
+
+def create_search_triggers_sql():
+    statements = []
+    for table, *columns in SEARCH_VECTOR_TRIGGERS:
+        statements.append(
+            f"CREATE TRIGGER {table}_search_vector_update "
+            f"BEFORE INSERT OR UPDATE OF {', '.join(columns)} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION "
+            f"tsvector_update_trigger(search_vector, 'pg_catalog.english', {', '.join(columns)});"
+        )
+        # Backfill existing rows
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        statements.append(
+            f"UPDATE {table} SET search_vector = to_tsvector('pg_catalog.english', {document});"
+        )
+    return statements
+
+
+def drop_search_triggers_sql():
+    return [
+        f"DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table};"
+        for table, *_ in SEARCH_VECTOR_TRIGGERS
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='aimentorsession',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='aimentorsession',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='mentor_session_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='assessment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='assessment_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='content_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='educator',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('first_name'), name='gin_trgm_ops'), name='educator_first_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='educator',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('last_name'), name='gin_trgm_ops'), name='educator_last_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='educator',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='educator_email_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('first_name'), name='gin_trgm_ops'), name='student_first_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('last_name'), name='gin_trgm_ops'), name='student_last_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='student_email_trgm'),
+        ),
+        migrations.RunSQL(
+            sql=create_search_triggers_sql(),
+            reverse_sql=drop_search_triggers_sql(),
+        ),
+    ]
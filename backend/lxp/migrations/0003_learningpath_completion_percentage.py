@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-14 05:49
+
+import django.core.validators
+from django.db import migrations, models
+
+
+BACKFILL_COMPLETION_PERCENTAGE = """
+UPDATE lxp_learningpath lp
+SET completion_percentage = COALESCE(
+    (SELECT COUNT(*) FROM lxp_progress p
+     WHERE p.learning_path_id = lp.id AND p.completed_at IS NOT NULL)::float * 100
+    / NULLIF((SELECT COUNT(*) FROM lxp_contentassignment ca WHERE ca.learning_path_id = lp.id), 0),
+    0
+)::numeric(5, 2);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0002_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='learningpath',
+            name='completion_percentage',
+            field=models.FloatField(default=0.0, help_text='Percentage of assigned content completed (denormalized from progress records)', validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(100.0)]),
+        ),
+        migrations.RunSQL(BACKFILL_COMPLETION_PERCENTAGE, reverse_sql=migrations.RunSQL.noop),
+    ]
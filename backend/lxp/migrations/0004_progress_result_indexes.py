@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-14 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0003_learningpath_completion_percentage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessmentresult',
+            index=models.Index(fields=['student', 'assessment'], name='result_student_assessment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assessmentresult',
+            index=models.Index(fields=['student', '-created_at'], name='result_student_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(fields=['student', '-updated_at'], name='progress_student_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(condition=models.Q(('mastery_level__lt', 60)), fields=['learning_path'], name='progress_low_mastery'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(condition=models.Q(('mastery_level__gte', 80)), fields=['learning_path'], name='progress_high_mastery'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-14 11:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0004_progress_result_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aimentorsession',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed')], default='completed', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='aimentorsession',
+            name='response',
+            field=models.TextField(blank=True, help_text="AI mentor's response from Grok"),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-14 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0005_aimentorsession_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessmentresult',
+            index=models.Index(fields=['-created_at'], name='result_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['-date'], name='attendance_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contentassignment',
+            index=models.Index(fields=['learning_path', 'order'], name='assignment_path_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(condition=models.Q(('completed_at__isnull', False)), fields=['learning_path'], name='progress_completed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(condition=models.Q(('status', 'needs_review')), fields=['student'], name='progress_needs_review_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0.2 on 2026-10-14 12:40
+
+from django.db import migrations
+
+
+# Large JSON/text payloads; Postgres TOAST-compresses these once they pass ~2KB
+LZ4_COLUMNS = [
+    ('lxp_assessment', 'questions'),
+    ('lxp_assessmentresult', 'answers'),
+    ('lxp_content', 'content_body'),
+    ('lxp_aimentorsession', 'query'),
+    ('lxp_aimentorsession', 'response'),
+    ('lxp_aimentorsession', 'context_data'),
+]
+
+
+def set_compression_sql(method):
+    # Servers built without lz4 keep the default pglz compression.
+    # Only values written after the change use the new method.
+    statements = "\n".join(
+        f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method};"
+        for table, column in LZ4_COLUMNS
+    )
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_settings
+                WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)
+            ) THEN
+                {statements}
+            END IF;
+        END $$;
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0006_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=set_compression_sql('lz4'),
+            reverse_sql=set_compression_sql('pglz'),
+        ),
+    ]
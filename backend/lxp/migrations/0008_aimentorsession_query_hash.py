@@ -0,0 +1,22 @@
+# Generated by Django 6.0.2 on 2026-10-14 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0007_lz4_toast_compression'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aimentorsession',
+            name='query_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='aimentorsession',
+            index=models.Index(fields=['student', 'query_hash', '-created_at'], name='mentor_session_query_hash_idx'),
+        ),
+    ]
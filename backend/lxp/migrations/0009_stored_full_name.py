@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-14 07:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0008_aimentorsession_query_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='educator',
+            name='educator_first_name_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='educator',
+            name='educator_last_name_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='student_first_name_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='student_last_name_trgm',
+        ),
+        migrations.AddField(
+            model_name='educator',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.AddIndex(
+            model_name='educator',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='educator_full_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='student_full_name_trgm'),
+        ),
+    ]
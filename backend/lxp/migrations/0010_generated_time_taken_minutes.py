@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-14 07:40
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+import django.db.models.functions.datetime
+import django.db.models.functions.math
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0009_stored_full_name'),
+    ]
+
+    operations = [
+        # A regular column can't be altered into a generated one, so drop and re-add it;
+        # Postgres fills the new column from the existing timestamps. The default and the
+        # UPDATE only run when migrating backwards, to restore the plain column's values
+        migrations.AlterField(
+            model_name='assessmentresult',
+            name='time_taken_minutes',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            migrations.RunSQL.noop,
+            reverse_sql=(
+                "UPDATE lxp_assessmentresult "
+                "SET time_taken_minutes = floor(extract(epoch FROM submitted_at - started_at) / 60)"
+            ),
+        ),
+        migrations.RemoveField(
+            model_name='assessmentresult',
+            name='time_taken_minutes',
+        ),
+        migrations.AddField(
+            model_name='assessmentresult',
+            name='time_taken_minutes',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.functions.math.Floor(django.db.models.expressions.CombinedExpression(django.db.models.functions.datetime.Extract(django.db.models.expressions.CombinedExpression(models.F('submitted_at'), '-', models.F('started_at')), 'epoch'), '/', models.Value(60))), models.IntegerField()), output_field=models.IntegerField()),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-14 08:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0010_generated_time_taken_minutes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='aimentorsession',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='assessmentresult',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='attendance',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='progress',
+            options={},
+        ),
+    ]
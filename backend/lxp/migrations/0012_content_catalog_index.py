@@ -0,0 +1,24 @@
+# Generated by Django 6.0.2 on 2026-10-14 08:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0011_drop_default_ordering'),
+    ]
+
+    operations = [
+        # Build the covering index before dropping the plain foreign key index
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['subject', 'difficulty_level', 'title', 'id'], name='content_catalog_idx'),
+        ),
+        migrations.AlterField(
+            model_name='content',
+            name='subject',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='contents', to='lxp.subject'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-14 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0012_content_catalog_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='learningpath',
+            index=models.Index(fields=['-updated_at'], name='path_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(fields=['-updated_at'], name='progress_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-14 09:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lxp', '0014_title_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='learningpath',
+            options={},
+        ),
+    ]
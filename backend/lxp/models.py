@@ -1,6 +1,24 @@
+import hashlib
+import json
+
 from django.db import models
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Extract, Floor, NullIf, Upper
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+
+
+# Shared by Content, LearningPath and Assessment
+DIFFICULTY_CHOICES = [
+    ('beginner', 'Beginner'),
+    ('intermediate', 'Intermediate'),
+    ('advanced', 'Advanced'),
+]
+# Valid keys, for checks on write paths that skip model validation (create(), update())
+DIFFICULTY_LEVELS = frozenset(key for key, _ in DIFFICULTY_CHOICES)
 
 
 class Student(models.Model):
@@ -35,6 +53,12 @@ class Student(models.Model):
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     email = models.EmailField(unique=True)
+    # Computed by Postgres on write, so listings and name search don't concatenate per row
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
     date_of_birth = models.DateField()
     gender = models.CharField(max_length=1, choices=GENDER_CHOICES)
 
@@ -52,14 +76,15 @@ class Student(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Trigram indexes so the admin's icontains search can use an index
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='student_full_name_trgm'),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='student_email_trgm'),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} (ID: {self.id})"
 
-    @property
-    def full_name(self):
-        return f"{self.first_name} {self.last_name}"
-
 
 class Educator(models.Model):
     """Educator/Teacher model."""
@@ -68,16 +93,24 @@ class Educator(models.Model):
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     email = models.EmailField(unique=True)
+    # Computed by Postgres on write, so listings and name search don't concatenate per row
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
     department = models.CharField(max_length=100, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def __str__(self):
-        return f"{self.first_name} {self.last_name}"
+    class Meta:
+        indexes = [
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='educator_full_name_trgm'),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='educator_email_trgm'),
+        ]
 
-    @property
-    def full_name(self):
+    def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
 
@@ -99,6 +132,12 @@ class Subject(models.Model):
         return f"{self.name} ({self.code})"
 
 
+class ContentQuerySet(models.QuerySet):
+    def list_view(self):
+        """Load only the narrow catalog columns, leaving out the body, attachments and search vector."""
+        return self.only('id', 'subject_id', 'title', 'content_type', 'difficulty_level', 'estimated_duration_minutes')
+
+
 class Content(models.Model):
     """Learning content/materials - SHARED library available to all students."""
 
@@ -112,7 +151,8 @@ class Content(models.Model):
     ]
 
     # Belongs to subject, NOT to a specific learning path (shared!)
-    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='contents')
+    # Lookups by subject are served by content_catalog_idx
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='contents', db_index=False)
 
     title = models.CharField(max_length=200)
     content_type = models.CharField(max_length=20, choices=CONTENT_TYPE_CHOICES)
@@ -122,36 +162,68 @@ class Content(models.Model):
     content_body = models.TextField(help_text="Main content body (can be HTML, Markdown, or plain text)")
 
     # Metadata
-    difficulty_level = models.CharField(max_length=20, choices=[
-        ('beginner', 'Beginner'),
-        ('intermediate', 'Intermediate'),
-        ('advanced', 'Advanced'),
-    ], default='beginner')
+    difficulty_level = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES, default='beginner')
     estimated_duration_minutes = models.IntegerField(default=30)
 
     # Resources
     external_url = models.URLField(blank=True, null=True)
     file_attachments = models.JSONField(default=list, blank=True)
 
+    # Full-text search over title + description, maintained by a database trigger
+    search_vector = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ContentQuerySet.as_manager()
+
     class Meta:
         ordering = ['subject', 'difficulty_level', 'title']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='content_search_vector_gin'),
+            # Admin title search and content autocomplete match substrings with icontains
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='content_title_trgm'),
+            # Catalog listing for one subject, optionally one difficulty, in display order
+            models.Index(fields=['subject', 'difficulty_level', 'title', 'id'], name='content_catalog_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.content_type})"
 
 
+class LearningPathQuerySet(models.QuerySet):
+    """Stored completion rollups for many learning paths at once, one correlated subquery per count."""
+
+    def _content_counts(self):
+        total_content = ContentAssignment.objects.filter(
+            learning_path=OuterRef('pk')
+        ).order_by().values('learning_path').annotate(count=Count('pk')).values('count')
+
+        completed_content = Progress.objects.filter(
+            learning_path=OuterRef('pk'),
+            completed_at__isnull=False
+        ).order_by().values('learning_path').annotate(count=Count('pk')).values('count')
+
+        return Subquery(total_content), Subquery(completed_content)
+
+    def _completion_percentage(self):
+        total_content, completed_content = self._content_counts()
+        # numeric(5, 2) rounds to two decimals; NULLIF/COALESCE map "no content" to 0
+        percentage = Cast(
+            Cast(completed_content, models.FloatField()) * 100 / NullIf(total_content, 0),
+            models.DecimalField(max_digits=5, decimal_places=2),
+        )
+        return Coalesce(percentage, 0, output_field=models.FloatField())
+
+    def refresh_completion_percentage(self):
+        """Recompute the stored completion percentage of every path in this queryset in one UPDATE."""
+        # update() skips auto_now; stamp updated_at so the educator dashboard ETag changes
+        return self.update(completion_percentage=self._completion_percentage(), updated_at=timezone.now())
+
+
 class LearningPath(models.Model):
     """Personalized learning path for a student - assigns shared content in custom order."""
 
-    DIFFICULTY_CHOICES = [
-        ('beginner', 'Beginner'),
-        ('intermediate', 'Intermediate'),
-        ('advanced', 'Advanced'),
-    ]
-
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='learning_paths')
     subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='learning_paths')
 
@@ -174,28 +246,32 @@ class LearningPath(models.Model):
     # Status
     is_active = models.BooleanField(default=True)
 
+    # Cached rollup of progress records, kept current by refresh_completion_percentage()
+    completion_percentage = models.FloatField(
+        default=0.0,
+        validators=[MinValueValidator(0.0), MaxValueValidator(100.0)],
+        help_text="Percentage of assigned content completed (denormalized from progress records)"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LearningPathQuerySet.as_manager()
+
     class Meta:
-        ordering = ['-created_at']
+        # No default ordering: the API lists and the admin order paths explicitly
+        indexes = [
+            # Newest write, read by the educator dashboard ETag
+            models.Index(fields=['-updated_at'], name='path_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.student.full_name}"
 
-    @property
-    def completion_percentage(self):
-        """Calculate completion percentage based on progress records."""
-        total_content = self.content_assignments.count()
-        if total_content == 0:
-            return 0.0
-
-        completed_content = Progress.objects.filter(
-            learning_path=self,
-            completed_at__isnull=False
-        ).count()
-
-        return round((completed_content / total_content) * 100, 2)
+    @classmethod
+    def refresh_completion_percentage(cls, learning_path_id):
+        """Recompute the stored completion percentage of a learning path in a single UPDATE."""
+        cls.objects.filter(pk=learning_path_id).refresh_completion_percentage()
 
 
 class ContentAssignment(models.Model):
@@ -216,6 +292,9 @@ class ContentAssignment(models.Model):
     class Meta:
         ordering = ['learning_path', 'order']
         unique_together = ['learning_path', 'content']
+        indexes = [
+            models.Index(fields=['learning_path', 'order'], name='assignment_path_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.learning_path.title} - {self.content.title} (#{self.order})"
@@ -245,18 +324,21 @@ class Assessment(models.Model):
     passing_score = models.IntegerField(default=70)
 
     # Metadata
-    difficulty_level = models.CharField(max_length=20, choices=[
-        ('beginner', 'Beginner'),
-        ('intermediate', 'Intermediate'),
-        ('advanced', 'Advanced'),
-    ], default='beginner')
+    difficulty_level = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES, default='beginner')
     time_limit_minutes = models.IntegerField(null=True, blank=True)
 
+    # Full-text search over title + description, maintained by a database trigger
+    search_vector = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['subject', 'difficulty_level', 'title']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='assessment_search_vector_gin'),
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='assessment_title_trgm'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.assessment_type})"
@@ -271,6 +353,7 @@ class Progress(models.Model):
         ('completed', 'Completed'),
         ('needs_review', 'Needs Review'),
     ]
+    STATUSES = frozenset(key for key, _ in STATUS_CHOICES)
 
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='progress_records')
     learning_path = models.ForeignKey(LearningPath, on_delete=models.CASCADE, related_name='progress_records')
@@ -307,8 +390,22 @@ class Progress(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-updated_at']
+        # No default ordering on the large tables: every list orders explicitly, and other
+        # queries shouldn't pay for a sort they don't use
         unique_together = ['student', 'learning_path', 'content']
+        # (student, learning_path) lookups are served by the unique_together index
+        indexes = [
+            models.Index(fields=['student', '-updated_at'], name='progress_student_updated_idx'),
+            # Newest write, read by the educator dashboard ETag
+            models.Index(fields=['-updated_at'], name='progress_updated_idx'),
+            # Struggling / strong topics for the AI mentor context
+            models.Index(fields=['learning_path'], condition=Q(mastery_level__lt=60), name='progress_low_mastery'),
+            models.Index(fields=['learning_path'], condition=Q(mastery_level__gte=80), name='progress_high_mastery'),
+            # Completed items per path, counted by LearningPath.refresh_completion_percentage()
+            models.Index(fields=['learning_path'], condition=Q(completed_at__isnull=False), name='progress_completed_idx'),
+            # Educator dashboard's students needing attention, grouped by student
+            models.Index(fields=['student'], condition=Q(status='needs_review'), name='progress_needs_review_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.full_name} - {self.content.title} - {self.status}"
@@ -329,7 +426,15 @@ class AssessmentResult(models.Model):
     # Timing
     started_at = models.DateTimeField()
     submitted_at = models.DateTimeField()
-    time_taken_minutes = models.IntegerField()
+    # Whole minutes between start and submission, computed by Postgres from the timestamps;
+    # the API rejects submissions before the start, so floor() never rounds a negative span
+    time_taken_minutes = models.GeneratedField(
+        expression=Cast(
+            Floor(Extract(F('submitted_at') - F('started_at'), 'epoch') / 60), models.IntegerField()
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
 
     # Feedback
     feedback = models.TextField(blank=True)
@@ -343,7 +448,12 @@ class AssessmentResult(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['student', 'assessment'], name='result_student_assessment_idx'),
+            models.Index(fields=['student', '-created_at'], name='result_student_created_idx'),
+            # Educator dashboard's most recent results across all students, and its ETag
+            models.Index(fields=['-created_at'], name='result_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.full_name} - {self.assessment.title} - {self.score}%"
@@ -368,8 +478,11 @@ class Attendance(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-date']
+        # (student, date) lookups are served by the unique_together index
         unique_together = ['student', 'date']
+        indexes = [
+            models.Index(fields=['-date'], name='attendance_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.full_name} - {self.date} - {self.status}"
@@ -415,24 +528,68 @@ class AIMentorSession(models.Model):
         ('feedback', 'Feedback Session'),
     ]
 
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='mentor_sessions')
     learning_path = models.ForeignKey(LearningPath, on_delete=models.CASCADE, related_name='mentor_sessions', null=True, blank=True)
 
     session_type = models.CharField(max_length=20, choices=SESSION_TYPE_CHOICES)
     query = models.TextField(help_text="Student's query or request")
-    response = models.TextField(help_text="AI mentor's response from Grok")
+    response = models.TextField(blank=True, help_text="AI mentor's response from Grok")
+    # Responses are generated by a Celery worker; clients poll until the session leaves 'pending'
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='completed')
 
     # Context for Grok API
     context_data = models.JSONField(default=dict, help_text="Additional context (current content, performance, etc.)")
+    # SHA-256 of the normalized query and prompt context, see hash_query()
+    query_hash = models.CharField(max_length=64, blank=True, editable=False)
 
     # Feedback on AI quality
     helpful = models.BooleanField(null=True, blank=True, help_text="Was this session helpful?")
     rating = models.IntegerField(null=True, blank=True, validators=[MinValueValidator(1), MaxValueValidator(5)])
 
+    # Full-text search over query + response, maintained by a database trigger
+    search_vector = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='mentor_session_search_gin'),
+            # Repeat questions, looked up by find_cached()
+            models.Index(fields=['student', 'query_hash', '-created_at'], name='mentor_session_query_hash_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.full_name} - {self.session_type} - {self.created_at.strftime('%Y-%m-%d %H:%M')}"
+
+    @staticmethod
+    def hash_query(query, context_data, system_context=None):
+        """Hash a query together with everything the mentor prompt is built from.
+
+        Case and whitespace in the query are ignored, so trivially different wordings
+        of the same question share a hash.
+        """
+        normalized = ' '.join(query.split()).casefold()
+        payload = json.dumps([normalized, context_data, system_context], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def find_cached(cls, student, query_hash, exclude_responses=()):
+        """Latest completed session of the student with the same query hash.
+
+        Sessions the student marked unhelpful are skipped, as are responses in
+        exclude_responses (e.g. canned error replies).
+        """
+        return (
+            cls.objects.filter(student=student, query_hash=query_hash, status='completed')
+            .exclude(helpful=False)
+            .exclude(response__in=exclude_responses)
+            .only('id', 'response')
+            .order_by('-created_at')
+            .first()
+        )
@@ -0,0 +1,20 @@
+"""
+Response renderers for the LXP API
+"""
+import orjson
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses with orjson, which is several times faster than stdlib json."""
+
+    media_type = "application/json"
+
+    # orjson handles datetimes, dates and UUIDs itself; this covers the rest
+    # (Decimal, lazy translation strings, pydantic models) the way ninja's default does
+    _fallback = NinjaJSONEncoder().default
+
+    def render(self, request, data, *, response_status):
+        # OPT_UTC_Z keeps UTC datetimes ending in 'Z', as the stdlib encoder wrote them
+        return orjson.dumps(data, default=self._fallback, option=orjson.OPT_UTC_Z)
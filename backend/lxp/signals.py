@@ -0,0 +1,39 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Assessment, AssessmentResult, Content, LearningPath, Progress, Student, Subject
+
+
+# Changes the educator dashboard can't see from its tables' newest timestamps
+DASHBOARD_VERSION_KEY = 'lxp:dashboard-version'
+
+
+def dashboard_version():
+    """Current educator dashboard version; a fresh one if the cache lost it."""
+    return cache.get_or_set(DASHBOARD_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def bump_dashboard_version():
+    """Invalidate educator dashboard ETags once the current transaction commits."""
+    transaction.on_commit(lambda: cache.set(DASHBOARD_VERSION_KEY, time.time_ns(), timeout=None))
+
+
+# Names and titles the dashboard shows, kept on rows its timestamps don't cover
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=Subject)
+@receiver(post_save, sender=Content)
+@receiver(post_save, sender=Assessment)
+# A delete leaves the newest remaining timestamp as it was
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Subject)
+@receiver(post_delete, sender=Content)
+@receiver(post_delete, sender=Assessment)
+@receiver(post_delete, sender=LearningPath)
+@receiver(post_delete, sender=Progress)
+@receiver(post_delete, sender=AssessmentResult)
+def invalidate_dashboard(sender, **kwargs):
+    bump_dashboard_version()
@@ -0,0 +1,68 @@
+from celery import shared_task
+from django.utils import timezone
+
+from .grok_service import grok_service
+from .models import AIMentorSession, AssessmentResult, LearningPath
+
+
+@shared_task
+def generate_mentor_response(session_id: int, system_context: str | None = None):
+    """Fill in a pending AI mentor session with Grok's response."""
+    session = AIMentorSession.objects.filter(id=session_id, status='pending').first()
+    if session is None:
+        return
+
+    try:
+        response_text = grok_service.chat(
+            user_message=session.query,
+            system_context=system_context,
+            student_context=session.context_data
+        )
+    except Exception as e:
+        print(f"Error generating mentor response for session {session_id}: {e}")
+        AIMentorSession.objects.filter(id=session_id).update(status='failed')
+        return
+
+    AIMentorSession.objects.filter(id=session_id).update(response=response_text, status='completed')
+
+
+@shared_task
+def generate_learning_path_goals(learning_path_id: int):
+    """Replace a new learning path's default goals with Grok's personalized ones."""
+    learning_path = LearningPath.objects.select_related('student', 'subject').filter(id=learning_path_id).first()
+    if learning_path is None:
+        return
+
+    try:
+        personalized_goals = grok_service.generate_personalized_goals(
+            student_grade=learning_path.student.grade_level,
+            subject=learning_path.subject.name,
+            difficulty=learning_path.difficulty_level
+        )
+    except Exception as e:
+        print(f"Error generating goals for learning path {learning_path_id}, keeping defaults: {e}")
+        return
+
+    LearningPath.objects.filter(id=learning_path_id).update(
+        personalized_goals=personalized_goals, updated_at=timezone.now()
+    )
+
+
+@shared_task
+def generate_result_feedback(result_id: int, questions_missed: list | None = None):
+    """Replace an assessment result's fallback feedback with Grok's personalized feedback."""
+    result = AssessmentResult.objects.select_related('assessment__subject').filter(id=result_id).first()
+    if result is None:
+        return
+
+    try:
+        ai_feedback = grok_service.generate_assessment_feedback(
+            score=result.score,
+            subject=result.assessment.subject.name,
+            questions_missed=questions_missed
+        )
+    except Exception as e:
+        print(f"Error generating feedback for assessment result {result_id}, keeping fallback: {e}")
+        return
+
+    AssessmentResult.objects.filter(id=result_id).update(ai_feedback=ai_feedback)
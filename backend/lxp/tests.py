@@ -1,3 +1,709 @@
-from django.test import TestCase
+import os
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.signals import request_finished
+from django.db import close_old_connections
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from ninja.testing import TestClient
+
+from config.celery import app as celery_app
+
+from .api import AIMentorChatInputSchema, api, stream_chat_with_ai_mentor
+from .grok_service import grok_service
+from .models import (
+    AIMentorSession,
+    Assessment,
+    AssessmentResult,
+    Attendance,
+    Badge,
+    Content,
+    ContentAssignment,
+    Educator,
+    LearningPath,
+    Progress,
+    Student,
+    Subject,
+)
+
+# config.urls has already registered the API's URL namespace by the time the tests
+# run; let the test client build the same API's URLs again without a ConfigError
+os.environ.setdefault('NINJA_SKIP_REGISTRY', 'yes')
+# One client for every test, so the API's URL patterns are built once
+api_client = TestClient(api)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class APITestCase(TestCase):
+    """One student on a two-item learning path, shared by the API tests."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='ada@student.lxp.com', email='ada@student.lxp.com', password='student123'
+        )
+        cls.student = Student.objects.create(
+            user=cls.user,
+            first_name='Ada',
+            last_name='Lovelace',
+            email='ada@student.lxp.com',
+            date_of_birth=date(2010, 12, 10),
+            gender='F',
+            grade_level=9,
+        )
+        cls.subject = Subject.objects.create(name='Mathematics', code='MATH9', description='Algebra', grade_level=9)
+        cls.contents = [
+            Content.objects.create(
+                subject=cls.subject,
+                title=title,
+                content_type='lesson',
+                description=f'{title} description',
+                content_body=f'{title} body',
+            )
+            for title in ['Linear Equations', 'Quadratic Equations']
+        ]
+        today = date.today()
+        cls.learning_path = LearningPath.objects.create(
+            student=cls.student,
+            subject=cls.subject,
+            title='Algebra Foundations',
+            description='Equations',
+            start_date=today,
+            target_completion_date=today + timedelta(days=30),
+        )
+        ContentAssignment.objects.bulk_create([
+            ContentAssignment(learning_path=cls.learning_path, content=content, order=order)
+            for order, content in enumerate(cls.contents, start=1)
+        ])
+        cls.progress = [
+            Progress.objects.create(student=cls.student, learning_path=cls.learning_path, content=content)
+            for content in cls.contents
+        ]
+
+    def setUp(self):
+        self.client = api_client
+
+    def run_tasks_eagerly(self):
+        # Run Celery tasks inline even when a broker is configured; settings read
+        # through the CELERY_ namespace take precedence over the plain setting names
+        self.addCleanup(celery_app.conf.update, CELERY_TASK_ALWAYS_EAGER=celery_app.conf.task_always_eager)
+        celery_app.conf.update(CELERY_TASK_ALWAYS_EAGER=True)
+
+
+class AIMentorChatTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.run_tasks_eagerly()
+
+    def chat(self, query='How do I solve 2x + 3 = 7?'):
+        return self.client.post('/ai-mentor/chat', json={
+            'student_id': self.student.id,
+            'learning_path_id': self.learning_path.id,
+            'session_type': 'question',
+            'query': query,
+        })
+
+    def test_chat_returns_pending_session(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.chat()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], 'pending')
+        self.assertEqual(response.json()['response'], '')
+        # Generation waits for the session row to be committed
+        self.assertEqual(len(callbacks), 1)
+
+    @mock.patch.object(grok_service, 'chat', return_value='Subtract 3, then divide by 2.')
+    def test_worker_fills_in_response(self, chat):
+        with self.captureOnCommitCallbacks(execute=True):
+            session_id = self.chat().json()['id']
+
+        chat.assert_called_once()
+        self.assertIn('Algebra Foundations', chat.call_args.kwargs['system_context'])
+        response = self.client.get(f'/ai-mentor/sessions/{session_id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'completed')
+        self.assertEqual(response.json()['response'], 'Subtract 3, then divide by 2.')
+
+    @mock.patch.object(grok_service, 'chat', side_effect=RuntimeError('Grok is down'))
+    def test_worker_error_marks_session_failed(self, chat):
+        with self.captureOnCommitCallbacks(execute=True):
+            session_id = self.chat().json()['id']
+
+        response = self.client.get(f'/ai-mentor/sessions/{session_id}')
+        self.assertEqual(response.json()['status'], 'failed')
+        self.assertEqual(response.json()['response'], '')
+
+    @mock.patch.object(grok_service, 'chat', return_value='Subtract 3, then divide by 2.')
+    def test_repeat_question_reuses_answer(self, chat):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chat()
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.chat('  how do I solve 2x + 3 = 7? ')
+
+        chat.assert_called_once()
+        self.assertEqual(callbacks, [])
+        self.assertEqual(response.json()['status'], 'completed')
+        self.assertEqual(response.json()['response'], 'Subtract 3, then divide by 2.')
+
+    @mock.patch.object(grok_service, 'chat', return_value='Subtract 3, then divide by 2.')
+    def test_unhelpful_answer_is_not_reused(self, chat):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chat()
+        AIMentorSession.objects.update(helpful=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chat()
+
+        self.assertEqual(chat.call_count, 2)
+
+    def test_unknown_session_is_404(self):
+        self.assertEqual(self.client.get('/ai-mentor/sessions/0').status_code, 404)
+
+
+class AIMentorStreamTests(APITestCase):
+    payload = {'session_type': 'question', 'query': 'How do I solve 2x + 3 = 7?'}
+
+    def stream(self):
+        return self.client.post('/ai-mentor/chat/stream', json={'student_id': self.student.id, **self.payload})
+
+    def session(self, response):
+        return AIMentorSession.objects.get(id=response['X-Session-Id'])
+
+    @mock.patch.object(grok_service, 'chat_stream', return_value=iter(['Subtract 3, ', 'then divide by 2.']))
+    def test_finished_stream_is_saved_and_reused(self, chat_stream):
+        response = self.stream()
+
+        self.assertEqual(response.content.decode(), 'Subtract 3, then divide by 2.')
+        self.assertEqual(self.session(response).status, 'completed')
+
+        repeat = self.stream()
+        chat_stream.assert_called_once()
+        self.assertEqual(repeat.content.decode(), 'Subtract 3, then divide by 2.')
+        self.assertEqual(self.session(repeat).status, 'completed')
+
+    def test_stream_ending_in_fallback_is_not_reused(self):
+        error_reply = grok_service.FALLBACK_REPLIES['error']
+        with mock.patch.object(grok_service, 'chat_stream', return_value=iter(['Subtract 3', error_reply])):
+            response = self.stream()
+
+        session = self.session(response)
+        self.assertEqual(session.status, 'failed')
+        self.assertEqual(session.response, f'Subtract 3{error_reply}')
+        self.assertIsNone(AIMentorSession.find_cached(self.student, session.query_hash))
+
+    @mock.patch.object(grok_service, 'chat_stream', return_value=iter(["I cannot help with that."]))
+    def test_refusal_is_not_reused(self, chat_stream):
+        response = self.stream()
+
+        self.assertEqual(self.session(response).status, 'failed')
+
+    @mock.patch.object(grok_service, 'chat_stream', return_value=iter(['Subtract 3, ', 'then divide by 2.']))
+    def test_disconnected_stream_is_not_reused(self, chat_stream):
+        request = RequestFactory().post('/ai-mentor/chat/stream')
+        response = stream_chat_with_ai_mentor(
+            request, AIMentorChatInputSchema(student_id=self.student.id, **self.payload)
+        )
+
+        # Read the first fragment, then hang up like a client closing the connection. Closing
+        # the response sends request_finished, which would drop the test's DB connection
+        next(iter(response.streaming_content))
+        request_finished.disconnect(close_old_connections)
+        try:
+            response.close()
+        finally:
+            request_finished.connect(close_old_connections)
+
+        session = self.session(response)
+        self.assertEqual(session.status, 'failed')
+        self.assertEqual(session.response, 'Subtract 3,')
+
+
+class StudentDashboardTests(APITestCase):
+    def test_student_dashboard_lists_newest_path_first(self):
+        newer = LearningPath.objects.create(
+            student=self.student,
+            subject=self.subject,
+            title='Quadratics',
+            description='Parabolas',
+            start_date=self.learning_path.start_date,
+            target_completion_date=self.learning_path.target_completion_date,
+        )
+
+        data = self.client.get(f'/dashboard/student/{self.student.id}').json()
+
+        self.assertEqual([path['id'] for path in data['learning_paths']], [newer.id, self.learning_path.id])
+        self.assertEqual(data['stats']['total_learning_paths'], 2)
+
+
+class LoginTests(APITestCase):
+    def login(self, password='student123', user_type='student', email='ada@student.lxp.com'):
+        return self.client.post('/auth/login', json={'email': email, 'password': password, 'user_type': user_type})
+
+    def test_student_login(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'user_id': self.user.id,
+            'email': 'ada@student.lxp.com',
+            'first_name': 'Ada',
+            'last_name': 'Lovelace',
+            'user_type': 'student',
+            'profile_id': self.student.id,
+        })
+
+    def test_educator_login(self):
+        user = User.objects.create_user(
+            username='grace@lxp.com', email='grace@lxp.com', password='teacher123'
+        )
+        educator = Educator.objects.create(
+            user=user, first_name='Grace', last_name='Hopper', email='grace@lxp.com'
+        )
+
+        response = self.login(email='grace@lxp.com', password='teacher123', user_type='educator')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['profile_id'], educator.id)
+
+    def test_login_uses_one_query(self):
+        with self.assertNumQueries(1):
+            self.login()
+
+    def test_wrong_password_is_401(self):
+        response = self.login(password='wrong')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {'detail': 'Invalid credentials'})
+
+    def test_unknown_email_is_401(self):
+        self.assertEqual(self.login(email='nobody@student.lxp.com').status_code, 401)
+
+    def test_inactive_user_is_401(self):
+        User.objects.filter(id=self.user.id).update(is_active=False)
+
+        self.assertEqual(self.login().status_code, 401)
+
+    def test_student_is_not_an_educator(self):
+        response = self.login(user_type='educator')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json(), {'detail': 'User is not an educator'})
+
+    def test_invalid_user_type_is_400(self):
+        self.assertEqual(self.login(user_type='admin').status_code, 400)
+
+
+class ContentProjectionTests(APITestCase):
+    def test_content_list_leaves_out_body(self):
+        response = self.client.get(f'/content?subject_id={self.subject.id}')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([item['title'] for item in data['items']], ['Linear Equations', 'Quadratic Equations'])
+        self.assertEqual(data['items'][0]['subject_name'], 'Mathematics')
+        self.assertNotIn('content_body', data['items'][0])
+
+    def test_content_list_query_skips_wide_columns(self):
+        with self.assertNumQueries(2) as queries:
+            self.client.get('/content')
+
+        self.assertNotIn('content_body', queries.captured_queries[-1]['sql'])
+        self.assertNotIn('file_attachments', queries.captured_queries[-1]['sql'])
+
+    def test_content_detail_includes_body(self):
+        response = self.client.get(f'/content/{self.contents[0].id}')
+
+        self.assertEqual(response.json()['content_body'], 'Linear Equations body')
+
+
+class PaginatedListTests(APITestCase):
+    def test_content_list_pages(self):
+        data = self.client.get('/content?limit=1&offset=1').json()
+
+        self.assertEqual(data['count'], 2)
+        self.assertEqual([item['title'] for item in data['items']], ['Quadratic Equations'])
+
+    def test_learning_path_list(self):
+        data = self.client.get(f'/learning-paths?student_id={self.student.id}').json()
+
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(data['items'][0]['student_name'], 'Ada Lovelace')
+        self.assertEqual(data['items'][0]['subject_name'], 'Mathematics')
+
+    def test_progress_list_pages_in_a_stable_order(self):
+        first = self.client.get(f'/progress?learning_path_id={self.learning_path.id}&limit=1').json()
+        second = self.client.get(f'/progress?learning_path_id={self.learning_path.id}&limit=1&offset=1').json()
+
+        self.assertEqual(first['count'], 2)
+        self.assertEqual(
+            {first['items'][0]['content_title'], second['items'][0]['content_title']},
+            {'Linear Equations', 'Quadratic Equations'},
+        )
+
+    def test_assessment_list(self):
+        Assessment.objects.create(
+            subject=self.subject, title='Equations Quiz', assessment_type='quiz', description='Solve for x'
+        )
+
+        data = self.client.get(f'/assessments?subject_id={self.subject.id}').json()
+
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(data['items'][0]['subject_name'], 'Mathematics')
+
+    def test_attendance_defaults_to_last_30_days(self):
+        today = timezone.localdate()
+        Attendance.objects.bulk_create([
+            Attendance(student=self.student, date=today, status='present'),
+            Attendance(student=self.student, date=today - timedelta(days=45), status='absent'),
+        ])
+
+        recent = self.client.get(f'/attendance?student_id={self.student.id}').json()
+        everything = self.client.get(
+            f'/attendance?student_id={self.student.id}&date_from={today - timedelta(days=60)}'
+        ).json()
+
+        self.assertEqual([item['status'] for item in recent['items']], ['present'])
+        self.assertEqual([item['status'] for item in everything['items']], ['present', 'absent'])
+
+
+class UpdateProgressTests(APITestCase):
+    def update(self, progress, **payload):
+        return self.client.put(f'/progress/{progress.id}', json=payload)
+
+    def test_started_at_is_stamped_once(self):
+        progress = self.progress[0]
+        started_at = self.update(progress, status='in_progress').json()['started_at']
+        self.assertIsNotNone(started_at)
+
+        response = self.update(progress, status='in_progress', completion_percentage=50)
+
+        self.assertEqual(response.json()['started_at'], started_at)
+        self.assertEqual(response.json()['completion_percentage'], 50)
+
+    def test_completed_at_is_stamped_once(self):
+        progress = self.progress[0]
+        completed_at = self.update(progress, status='completed').json()['completed_at']
+        self.assertIsNotNone(completed_at)
+
+        self.assertEqual(self.update(progress, status='completed').json()['completed_at'], completed_at)
+
+    def test_update_is_one_statement(self):
+        # One UPDATE for the changes, one SELECT for the response
+        with self.assertNumQueries(2):
+            self.update(self.progress[0], status='in_progress', time_spent_minutes=15, mastery_level=40)
+
+    def test_update_bumps_updated_at(self):
+        before = Progress.objects.get(id=self.progress[0].id).updated_at
+
+        self.update(self.progress[0], mastery_level=75)
+
+        self.assertGreater(Progress.objects.get(id=self.progress[0].id).updated_at, before)
+
+    def test_completion_refreshes_learning_path(self):
+        self.update(self.progress[0], status='completed')
+
+        self.learning_path.refresh_from_db()
+        self.assertEqual(self.learning_path.completion_percentage, 50.0)
+
+    def test_invalid_status_is_rejected(self):
+        self.assertEqual(self.update(self.progress[0], status='finished').status_code, 422)
+
+    def test_unknown_progress_is_404(self):
+        self.assertEqual(self.client.put('/progress/0', json={'status': 'completed'}).status_code, 404)
+
+
+class CreateLearningPathTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.run_tasks_eagerly()
+
+    def create(self):
+        today = date.today()
+        return self.client.post('/learning-paths', json={
+            'student_id': self.student.id,
+            'subject_id': self.subject.id,
+            'title': 'Quadratics',
+            'description': 'Factoring and the quadratic formula',
+            'difficulty_level': 'intermediate',
+            'content_ids': [content.id for content in self.contents],
+            'start_date': today.isoformat(),
+            'target_completion_date': (today + timedelta(days=30)).isoformat(),
+        })
+
+    @mock.patch.object(grok_service, 'generate_personalized_goals')
+    def test_create_returns_default_goals(self, goals):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.create()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['personalized_goals'][0], 'Master core concepts in Mathematics')
+        goals.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+
+    @mock.patch.object(grok_service, 'generate_personalized_goals', return_value=['Factor trinomials'])
+    def test_worker_fills_in_goals(self, goals):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.create()
+
+        learning_path = LearningPath.objects.get(id=response.json()['id'])
+        self.assertEqual(learning_path.personalized_goals, ['Factor trinomials'])
+        self.assertGreater(learning_path.updated_at, learning_path.created_at)
+        goals.assert_called_once_with(student_grade=9, subject='Mathematics', difficulty='intermediate')
+
+
+class SubmitAssessmentTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.assessment = Assessment.objects.create(
+            subject=cls.subject,
+            content=cls.contents[0],
+            title='Linear Equations Quiz',
+            assessment_type='quiz',
+            description='Solve for x',
+            questions=[
+                {'id': 1, 'question': '2x = 4', 'correct_answer': '2'},
+                {'id': 2, 'question': 'x + 1 = 3', 'correct_answer': '2'},
+            ],
+        )
+
+    def submit(self, started_at, submitted_at, answers=None):
+        return self.client.post(f'/assessments/{self.assessment.id}/submit', json={
+            'student_id': self.student.id,
+            'learning_path_id': self.learning_path.id,
+            'answers': answers or {'1': '2', '2': '2'},
+            'started_at': started_at.isoformat(),
+            'submitted_at': submitted_at.isoformat(),
+        })
+
+    def test_passing_submission_completes_progress(self):
+        started_at = timezone.now() - timedelta(minutes=10)
+        response = self.submit(started_at, started_at + timedelta(minutes=7, seconds=59))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['score'], 100.0)
+        self.assertEqual(response.json()['time_taken_minutes'], 7)
+        self.assertEqual(Progress.objects.get(id=self.progress[0].id).status, 'completed')
+        self.learning_path.refresh_from_db()
+        self.assertEqual(self.learning_path.completion_percentage, 50.0)
+
+    def test_failing_submission_needs_review(self):
+        started_at = timezone.now() - timedelta(minutes=10)
+        response = self.submit(started_at, started_at + timedelta(minutes=5), answers={'1': '3', '2': '2'})
+
+        self.assertFalse(response.json()['passed'])
+        self.assertEqual(Progress.objects.get(id=self.progress[0].id).status, 'needs_review')
+
+    def test_failed_attempt_keeps_completion(self):
+        Progress.objects.filter(id=self.progress[0].id).update(status='completed', completed_at=timezone.now())
+        started_at = timezone.now() - timedelta(minutes=10)
+
+        self.submit(started_at, started_at + timedelta(minutes=5), answers={'1': '3', '2': '3'})
+
+        progress = Progress.objects.get(id=self.progress[0].id)
+        self.assertEqual(progress.status, 'needs_review')
+        self.assertIsNotNone(progress.completed_at)
+        self.assertEqual(progress.mastery_level, 0.0)
+
+    def test_submission_without_progress_row_saves_result(self):
+        Progress.objects.filter(id=self.progress[0].id).delete()
+        started_at = timezone.now() - timedelta(minutes=10)
+
+        response = self.submit(started_at, started_at + timedelta(minutes=5))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(AssessmentResult.objects.filter(id=response.json()['id']).exists())
+
+    def test_submission_before_start_is_rejected(self):
+        started_at = timezone.now()
+        response = self.submit(started_at, started_at - timedelta(seconds=30))
+
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(AssessmentResult.objects.exists())
+
+    @mock.patch.object(grok_service, 'generate_assessment_feedback')
+    def test_submission_returns_score_based_feedback(self, feedback):
+        started_at = timezone.now() - timedelta(minutes=10)
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.submit(started_at, started_at + timedelta(minutes=5))
+
+        self.assertEqual(response.json()['ai_feedback'], grok_service._fallback_feedback(100.0))
+        feedback.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+
+    @mock.patch.object(grok_service, 'generate_assessment_feedback', return_value='Review one-step equations.')
+    def test_worker_fills_in_feedback(self, feedback):
+        self.run_tasks_eagerly()
+        started_at = timezone.now() - timedelta(minutes=10)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.submit(started_at, started_at + timedelta(minutes=5), answers={'1': '3', '2': '2'})
+
+        result = AssessmentResult.objects.get(id=response.json()['id'])
+        self.assertEqual(result.ai_feedback, 'Review one-step equations.')
+        feedback.assert_called_once_with(score=50.0, subject='Mathematics', questions_missed=['2x = 4'])
+
+
+class EducatorDashboardETagTests(APITestCase):
+    def dashboard(self, etag=None, **params):
+        headers = {'If-None-Match': etag} if etag else {}
+        return self.client.get('/dashboard/educator', query_params=params, headers=headers)
+
+    def assertChanged(self, etag):
+        response = self.dashboard(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_unchanged_dashboard_is_304(self):
+        etag = self.dashboard()['ETag']
+
+        # The version lookup is a cache read; the timestamps are three index lookups
+        with self.assertNumQueries(3):
+            response = self.dashboard(etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_other_page_is_200(self):
+        etag = self.dashboard()['ETag']
+
+        self.assertEqual(self.dashboard(etag, offset=50).status_code, 200)
+
+    def test_progress_update_changes_etag(self):
+        etag = self.dashboard()['ETag']
+
+        self.client.put(f'/progress/{self.progress[0].id}', json={'status': 'needs_review'})
+
+        self.assertChanged(etag)
+
+    def test_completion_refresh_changes_etag(self):
+        etag = self.dashboard()['ETag']
+
+        LearningPath.objects.filter(id=self.learning_path.id).refresh_completion_percentage()
+
+        self.assertChanged(etag)
+
+    def test_student_rename_changes_etag(self):
+        etag = self.dashboard()['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.last_name = 'King'
+            self.student.save()
+
+        self.assertChanged(etag)
+
+    def test_delete_changes_etag(self):
+        etag = self.dashboard()['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.progress[1].delete()
+
+        self.assertChanged(etag)
+
+
+class AdminSearchTests(APITestCase):
+    def search(self, model, search_term):
+        model_admin = admin.site.get_model_admin(model)
+        request = RequestFactory().get('/admin/')
+        queryset, _ = model_admin.get_search_results(request, model.objects.all(), search_term)
+        return list(queryset.values_list('title', flat=True))
+
+    def test_content_title_matches_substring(self):
+        self.assertEqual(self.search(Content, 'quadr'), ['Quadratic Equations'])
+
+    def test_content_description_matches_words(self):
+        self.assertEqual(self.search(Content, 'descriptions linear'), ['Linear Equations'])
+
+
+class ProgressAdminTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.model_admin = admin.site.get_model_admin(Progress)
+        self.request = RequestFactory().post('/admin/')
+        self.request.user = User(is_active=True, is_staff=True, is_superuser=True)
+        Progress.objects.filter(id=self.progress[0].id).update(status='completed', completed_at=timezone.now())
+        self.learning_path.refresh_completion_percentage(self.learning_path.id)
+
+    def completion(self):
+        self.learning_path.refresh_from_db()
+        return self.learning_path.completion_percentage
+
+    def test_edit_refreshes_completion(self):
+        progress = Progress.objects.get(id=self.progress[1].id)
+        form = self.model_admin.get_form(self.request, progress)(instance=progress)
+        progress.status, progress.completed_at = 'completed', timezone.now()
+
+        self.model_admin.save_model(self.request, progress, form, change=True)
+
+        self.assertEqual(self.completion(), 100.0)
+
+    def test_delete_refreshes_completion(self):
+        self.model_admin.delete_model(self.request, Progress.objects.get(id=self.progress[0].id))
+
+        self.assertEqual(self.completion(), 0.0)
+
+    def test_bulk_delete_refreshes_completion(self):
+        self.assertEqual(self.completion(), 50.0)
+
+        self.model_admin.delete_queryset(self.request, Progress.objects.filter(id=self.progress[0].id))
+
+        self.assertEqual(self.completion(), 0.0)
+
+
+class GrokServiceTests(SimpleTestCase):
+    def test_feedback_key_follows_prompt_score(self):
+        third = 2 / 3 * 100
+        self.assertIn('about 70%', grok_service._feedback_prompt(third, 'Mathematics'))
+
+        self.assertEqual(
+            grok_service._feedback_cache_key(third, 'Mathematics'),
+            grok_service._feedback_cache_key(72.0, 'Mathematics'),
+        )
+        self.assertNotEqual(
+            grok_service._feedback_cache_key(third, 'Mathematics'),
+            grok_service._feedback_cache_key(76.0, 'Mathematics'),
+        )
+
+    def test_cached_feedback_quotes_exact_score(self):
+        with mock.patch.object(grok_service, 'client') as client:
+            client.chat.completions.create.return_value.choices = [
+                mock.Mock(message=mock.Mock(content='Review factoring.'))
+            ]
+            first = grok_service.generate_assessment_feedback(2 / 3 * 100, 'Geometry')
+            second = grok_service.generate_assessment_feedback(72.0, 'Geometry')
+
+        self.assertEqual(first, 'You scored 66.7%. Review factoring.')
+        self.assertEqual(second, 'You scored 72%. Review factoring.')
+        client.chat.completions.create.assert_called_once()
+
+    def test_feedback_key_ignores_missed_question_order(self):
+        self.assertEqual(
+            grok_service._feedback_cache_key(50.0, 'Mathematics', ['2x = 4', 'x + 1 = 3']),
+            grok_service._feedback_cache_key(50.0, 'Mathematics', ['x + 1 = 3', '2x = 4']),
+        )
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class SeedDataTests(TestCase):
+    models = [Subject, Content, Badge, User, Student, Educator]
+
+    def test_seed_data_is_idempotent(self):
+        call_command('seed_data', stdout=StringIO())
+        counts = {model: model.objects.count() for model in self.models}
+        self.assertTrue(all(counts.values()))
+
+        call_command('seed_data', stdout=StringIO())
+
+        self.assertEqual({model: model.objects.count() for model in self.models}, counts)
+
+    def test_failed_seed_leaves_no_rows(self):
+        with mock.patch.object(Student.objects, 'bulk_create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                call_command('seed_data', stdout=StringIO())
+
+        self.assertFalse(Subject.objects.exists())
+        self.assertFalse(User.objects.exists())
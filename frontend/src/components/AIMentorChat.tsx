@@ -1,6 +1,6 @@
 import { useState } from 'react'
-import { lxpApiChatWithAiMentor } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { streamAiMentor } from '../utils/aiMentor'
 
 interface AIMentorChatProps {
   studentId: number
@@ -48,6 +48,7 @@ export default function AIMentorChat({ studentId, studentName, learningPaths, pr
   ])
   const [input, setInput] = useState('')
   const [loading, setLoading] = useState(false)
+  const [streamingText, setStreamingText] = useState('')
 
   const sendMessage = async () => {
     if (!input.trim() || loading) return
@@ -69,33 +70,31 @@ export default function AIMentorChat({ studentId, studentName, learningPaths, pr
       // Find the most relevant active learning path
       const activePath = learningPaths.find((p: any) => p.is_active) || learningPaths[0]
 
-      const response = await lxpApiChatWithAiMentor({
-        body: {
+      // Show Grok's answer as it streams in
+      const response = await streamAiMentor(
+        {
           student_id: studentId,
           session_type: 'help',
           query: userMessage,
           learning_path_id: activePath?.id,
         },
-      })
-
-      if (response.data?.response) {
-        // Validate response is not empty
-        const responseText = response.data.response.trim()
-        if (!responseText) {
-          throw new Error('Empty response from AI')
-        }
-
-        setMessages((prev) => [
-          ...prev,
-          {
-            type: 'ai',
-            text: responseText,
-            timestamp: new Date(),
-          },
-        ])
-      } else {
-        throw new Error('Invalid response structure')
+        setStreamingText,
+      )
+
+      // Validate response is not empty
+      const responseText = response.trim()
+      if (!responseText) {
+        throw new Error('Empty response from AI')
       }
+
+      setMessages((prev) => [
+        ...prev,
+        {
+          type: 'ai',
+          text: responseText,
+          timestamp: new Date(),
+        },
+      ])
     } catch (error: any) {
       console.error('Chat error:', error)
 
@@ -119,6 +118,7 @@ export default function AIMentorChat({ studentId, studentName, learningPaths, pr
         },
       ])
     } finally {
+      setStreamingText('')
       setLoading(false)
     }
   }
@@ -155,7 +155,7 @@ export default function AIMentorChat({ studentId, studentName, learningPaths, pr
           <div className="message ai">
             <div className="message-avatar">🤖</div>
             <div className="message-content">
-              <p className="typing-indicator">Thinking...</p>
+              {streamingText ? <p>{streamingText}</p> : <p className="typing-indicator">Thinking...</p>}
             </div>
           </div>
         )}
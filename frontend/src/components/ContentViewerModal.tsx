@@ -1,7 +1,8 @@
 import { useState } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
-import { lxpApiGetContent, lxpApiChatWithAiMentor, lxpApiUpdateProgress } from '../generated/sdk.gen'
+import { lxpApiGetContent, lxpApiUpdateProgress } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { askAiMentor } from '../utils/aiMentor'
 
 interface ContentViewerModalProps {
   contentId: number
@@ -79,22 +80,20 @@ export default function ContentViewerModal({ contentId, studentId, learningPathI
     setLoading(true)
 
     try {
-      const response = await lxpApiChatWithAiMentor({
-        body: {
-          student_id: studentId,
-          session_type: 'help',
-          query: userMessage,
-          learning_path_id: learningPathId,
-          content_id: contentId,
-        },
+      const session = await askAiMentor({
+        student_id: studentId,
+        session_type: 'help',
+        query: userMessage,
+        learning_path_id: learningPathId,
+        content_id: contentId,
       })
 
-      if (response.data?.response) {
+      if (session?.response) {
         setMessages((prev) => [
           ...prev,
           {
             type: 'ai',
-            text: response.data.response.trim(),
+            text: session.response.trim(),
             timestamp: new Date(),
           },
         ])
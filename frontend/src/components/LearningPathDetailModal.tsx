@@ -2,6 +2,7 @@ import { useState } from 'react'
 import { useQuery } from '@tanstack/react-query'
 import { lxpApiGetLearningPath, lxpApiListProgress } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { fetchAllPages } from '../utils/pagination'
 import ContentViewerModal from './ContentViewerModal'
 
 interface LearningPathDetailModalProps {
@@ -27,10 +28,9 @@ export default function LearningPathDetailModal({ pathId, onClose }: LearningPat
   const { data: progressData, isLoading: progressLoading } = useQuery({
     queryKey: ['progress', 'path', pathId],
     queryFn: async () => {
-      const response = await lxpApiListProgress({
-        query: { learning_path_id: pathId }
-      })
-      return response.data ?? []
+      return fetchAllPages((page) => lxpApiListProgress({
+        query: { learning_path_id: pathId, ...page }
+      }))
     },
   })
 
@@ -2,7 +2,7 @@
 
 import type { Client, Options as Options2, TDataShape } from './client';
 import { client } from './client.gen';
-import type { LxpApiChatWithAiMentorData, LxpApiChatWithAiMentorResponses, LxpApiCreateLearningPathData, LxpApiCreateLearningPathResponses, LxpApiCreateStudentData, LxpApiCreateStudentResponses, LxpApiGetAssessmentData, LxpApiGetAssessmentResponses, LxpApiGetContentData, LxpApiGetContentResponses, LxpApiGetEducatorDashboardData, LxpApiGetEducatorDashboardResponses, LxpApiGetLearningPathData, LxpApiGetLearningPathResponses, LxpApiGetStudentDashboardData, LxpApiGetStudentDashboardResponses, LxpApiGetStudentData, LxpApiGetStudentResponses, LxpApiGetSubjectData, LxpApiGetSubjectResponses, LxpApiListAssessmentsData, LxpApiListAssessmentsResponses, LxpApiListAttendanceData, LxpApiListAttendanceResponses, LxpApiListContentData, LxpApiListContentResponses, LxpApiListLearningPathsData, LxpApiListLearningPathsResponses, LxpApiListProgressData, LxpApiListProgressResponses, LxpApiListStudentsData, LxpApiListStudentsResponses, LxpApiListSubjectsData, LxpApiListSubjectsResponses, LxpApiLoginData, LxpApiLoginResponses, LxpApiSubmitAssessmentData, LxpApiSubmitAssessmentResponses, LxpApiUpdateProgressData, LxpApiUpdateProgressResponses } from './types.gen';
+import type { LxpApiChatWithAiMentorData, LxpApiChatWithAiMentorResponses, LxpApiCreateLearningPathData, LxpApiCreateLearningPathResponses, LxpApiCreateStudentData, LxpApiCreateStudentResponses, LxpApiGetAiMentorSessionData, LxpApiGetAiMentorSessionResponses, LxpApiGetAssessmentData, LxpApiGetAssessmentResponses, LxpApiGetContentData, LxpApiGetContentResponses, LxpApiGetEducatorDashboardData, LxpApiGetEducatorDashboardResponses, LxpApiGetLearningPathData, LxpApiGetLearningPathResponses, LxpApiGetStudentDashboardData, LxpApiGetStudentDashboardResponses, LxpApiGetStudentData, LxpApiGetStudentResponses, LxpApiGetSubjectData, LxpApiGetSubjectResponses, LxpApiListAssessmentsData, LxpApiListAssessmentsResponses, LxpApiListAttendanceData, LxpApiListAttendanceResponses, LxpApiListContentData, LxpApiListContentResponses, LxpApiListLearningPathsData, LxpApiListLearningPathsResponses, LxpApiListProgressData, LxpApiListProgressResponses, LxpApiListStudentsData, LxpApiListStudentsResponses, LxpApiListSubjectsData, LxpApiListSubjectsResponses, LxpApiLoginData, LxpApiLoginResponses, LxpApiSubmitAssessmentData, LxpApiSubmitAssessmentResponses, LxpApiUpdateProgressData, LxpApiUpdateProgressResponses } from './types.gen';
 
 export type Options<TData extends TDataShape = TDataShape, ThrowOnError extends boolean = boolean> = Options2<TData, ThrowOnError> & {
     /**
@@ -233,7 +233,10 @@ export const lxpApiSubmitAssessment = <ThrowOnError extends boolean = false>(opt
 /**
  * Chat With Ai Mentor
  *
- * Chat with the AI mentor (Grok) with full learning context.
+ * Start a chat with the AI mentor (Grok) with full learning context.
+ *
+ * The response is generated in the background; poll the returned session until
+ * its status is no longer 'pending'.
  */
 export const lxpApiChatWithAiMentor = <ThrowOnError extends boolean = false>(options: Options<LxpApiChatWithAiMentorData, ThrowOnError>) => {
     return (options.client ?? client).post<LxpApiChatWithAiMentorResponses, unknown, ThrowOnError>({
@@ -246,10 +249,22 @@ export const lxpApiChatWithAiMentor = <ThrowOnError extends boolean = false>(opt
     });
 };
 
+/**
+ * Get Ai Mentor Session
+ *
+ * Get an AI mentor session, including its response once generated.
+ */
+export const lxpApiGetAiMentorSession = <ThrowOnError extends boolean = false>(options: Options<LxpApiGetAiMentorSessionData, ThrowOnError>) => {
+    return (options.client ?? client).get<LxpApiGetAiMentorSessionResponses, unknown, ThrowOnError>({
+        url: '/api/ai-mentor/sessions/{session_id}',
+        ...options
+    });
+};
+
 /**
  * List Attendance
  *
- * List attendance records.
+ * List attendance records, from the last 30 days unless date_from is given.
  */
 export const lxpApiListAttendance = <ThrowOnError extends boolean = false>(options?: Options<LxpApiListAttendanceData, ThrowOnError>) => {
     return (options?.client ?? client).get<LxpApiListAttendanceResponses, unknown, ThrowOnError>({
@@ -198,6 +198,62 @@ export type SubjectOutputSchema = {
     grade_level: number;
 };
 
+/**
+ * ContentListOutputSchema
+ */
+export type ContentListOutputSchema = {
+    /**
+     * Id
+     */
+    id: number;
+    /**
+     * Subject Id
+     */
+    subject_id: number;
+    /**
+     * Subject Name
+     */
+    subject_name: string;
+    /**
+     * Title
+     */
+    title: string;
+    /**
+     * Content Type
+     */
+    content_type: string;
+    /**
+     * Description
+     */
+    description: string;
+    /**
+     * Difficulty Level
+     */
+    difficulty_level: string;
+    /**
+     * Estimated Duration Minutes
+     */
+    estimated_duration_minutes: number;
+    /**
+     * External Url
+     */
+    external_url?: string | null;
+};
+
+/**
+ * PagedContentListOutputSchema
+ */
+export type PagedContentListOutputSchema = {
+    /**
+     * Items
+     */
+    items: Array<ContentListOutputSchema>;
+    /**
+     * Count
+     */
+    count: number;
+};
+
 /**
  * ContentOutputSchema
  */
@@ -245,13 +301,13 @@ export type ContentOutputSchema = {
 };
 
 /**
- * PagedContentOutputSchema
+ * PagedLearningPathOutputSchema
  */
-export type PagedContentOutputSchema = {
+export type PagedLearningPathOutputSchema = {
     /**
      * Items
      */
-    items: Array<ContentOutputSchema>;
+    items: Array<LearningPathOutputSchema>;
     /**
      * Count
      */
@@ -360,6 +416,20 @@ export type LearningPathInputSchema = {
     content_ids: Array<number>;
 };
 
+/**
+ * PagedProgressOutputSchema
+ */
+export type PagedProgressOutputSchema = {
+    /**
+     * Items
+     */
+    items: Array<ProgressOutputSchema>;
+    /**
+     * Count
+     */
+    count: number;
+};
+
 /**
  * ProgressOutputSchema
  */
@@ -440,6 +510,20 @@ export type ProgressInputSchema = {
     score?: number | null;
 };
 
+/**
+ * PagedAssessmentOutputSchema
+ */
+export type PagedAssessmentOutputSchema = {
+    /**
+     * Items
+     */
+    items: Array<AssessmentOutputSchema>;
+    /**
+     * Count
+     */
+    count: number;
+};
+
 /**
  * AssessmentOutputSchema
  */
@@ -600,6 +684,10 @@ export type AiMentorResponseOutputSchema = {
      * Response
      */
     response: string;
+    /**
+     * Status
+     */
+    status: string;
     /**
      * Created At
      */
@@ -632,6 +720,20 @@ export type AiMentorChatInputSchema = {
     query: string;
 };
 
+/**
+ * PagedAttendanceOutputSchema
+ */
+export type PagedAttendanceOutputSchema = {
+    /**
+     * Items
+     */
+    items: Array<AttendanceOutputSchema>;
+    /**
+     * Count
+     */
+    count: number;
+};
+
 /**
  * AttendanceOutputSchema
  */
@@ -803,7 +905,7 @@ export type LxpApiListContentResponses = {
     /**
      * OK
      */
-    200: PagedContentOutputSchema;
+    200: PagedContentListOutputSchema;
 };
 
 export type LxpApiListContentResponse = LxpApiListContentResponses[keyof LxpApiListContentResponses];
@@ -837,17 +939,23 @@ export type LxpApiListLearningPathsData = {
          * Student Id
          */
         student_id?: number | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Offset
+         */
+        offset?: number;
     };
     url: '/api/learning-paths';
 };
 
 export type LxpApiListLearningPathsResponses = {
     /**
-     * Response
-     *
      * OK
      */
-    200: Array<LearningPathOutputSchema>;
+    200: PagedLearningPathOutputSchema;
 };
 
 export type LxpApiListLearningPathsResponse = LxpApiListLearningPathsResponses[keyof LxpApiListLearningPathsResponses];
@@ -901,17 +1009,23 @@ export type LxpApiListProgressData = {
          * Learning Path Id
          */
         learning_path_id?: number | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Offset
+         */
+        offset?: number;
     };
     url: '/api/progress';
 };
 
 export type LxpApiListProgressResponses = {
     /**
-     * Response
-     *
      * OK
      */
-    200: Array<ProgressOutputSchema>;
+    200: PagedProgressOutputSchema;
 };
 
 export type LxpApiListProgressResponse = LxpApiListProgressResponses[keyof LxpApiListProgressResponses];
@@ -945,17 +1059,23 @@ export type LxpApiListAssessmentsData = {
          * Subject Id
          */
         subject_id?: number | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Offset
+         */
+        offset?: number;
     };
     url: '/api/assessments';
 };
 
 export type LxpApiListAssessmentsResponses = {
     /**
-     * Response
-     *
      * OK
      */
-    200: Array<AssessmentOutputSchema>;
+    200: PagedAssessmentOutputSchema;
 };
 
 export type LxpApiListAssessmentsResponse = LxpApiListAssessmentsResponses[keyof LxpApiListAssessmentsResponses];
@@ -1010,13 +1130,34 @@ export type LxpApiChatWithAiMentorData = {
 };
 
 export type LxpApiChatWithAiMentorResponses = {
+    /**
+     * Accepted
+     */
+    202: AiMentorResponseOutputSchema;
+};
+
+export type LxpApiChatWithAiMentorResponse = LxpApiChatWithAiMentorResponses[keyof LxpApiChatWithAiMentorResponses];
+
+export type LxpApiGetAiMentorSessionData = {
+    body?: never;
+    path: {
+        /**
+         * Session Id
+         */
+        session_id: number;
+    };
+    query?: never;
+    url: '/api/ai-mentor/sessions/{session_id}';
+};
+
+export type LxpApiGetAiMentorSessionResponses = {
     /**
      * OK
      */
     200: AiMentorResponseOutputSchema;
 };
 
-export type LxpApiChatWithAiMentorResponse = LxpApiChatWithAiMentorResponses[keyof LxpApiChatWithAiMentorResponses];
+export type LxpApiGetAiMentorSessionResponse = LxpApiGetAiMentorSessionResponses[keyof LxpApiGetAiMentorSessionResponses];
 
 export type LxpApiListAttendanceData = {
     body?: never;
@@ -1030,17 +1171,23 @@ export type LxpApiListAttendanceData = {
          * Date From
          */
         date_from?: string | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Offset
+         */
+        offset?: number;
     };
     url: '/api/attendance';
 };
 
 export type LxpApiListAttendanceResponses = {
     /**
-     * Response
-     *
      * OK
      */
-    200: Array<AttendanceOutputSchema>;
+    200: PagedAttendanceOutputSchema;
 };
 
 export type LxpApiListAttendanceResponse = LxpApiListAttendanceResponses[keyof LxpApiListAttendanceResponses];
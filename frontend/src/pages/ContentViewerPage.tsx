@@ -1,7 +1,9 @@
 import { useState } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
-import { lxpApiGetContent, lxpApiChatWithAiMentor, lxpApiUpdateProgress, lxpApiListProgress } from '../generated/sdk.gen'
+import { lxpApiGetContent, lxpApiUpdateProgress, lxpApiListProgress } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { fetchAllPages } from '../utils/pagination'
+import { askAiMentor } from '../utils/aiMentor'
 
 interface ContentViewerPageProps {
   contentId: number
@@ -40,13 +42,13 @@ export default function ContentViewerPage({ contentId, studentId, learningPathId
   const { data: progressData, isLoading: progressLoading } = useQuery({
     queryKey: ['progress', 'content', contentId, learningPathId],
     queryFn: async () => {
-      const response = await lxpApiListProgress({
+      const allProgress = await fetchAllPages((page) => lxpApiListProgress({
         query: {
           learning_path_id: learningPathId,
           student_id: studentId,
+          ...page,
         },
-      })
-      const allProgress = response.data ?? []
+      }))
       return allProgress.find((p: any) => p.content_id === contentId)
     },
     enabled: !!progressId,
@@ -107,22 +109,20 @@ export default function ContentViewerPage({ contentId, studentId, learningPathId
     setLoading(true)
 
     try {
-      const response = await lxpApiChatWithAiMentor({
-        body: {
-          student_id: studentId,
-          session_type: 'help',
-          query: userMessage,
-          learning_path_id: learningPathId,
-          content_id: contentId,
-        },
+      const session = await askAiMentor({
+        student_id: studentId,
+        session_type: 'help',
+        query: userMessage,
+        learning_path_id: learningPathId,
+        content_id: contentId,
       })
 
-      if (response.data?.response) {
+      if (session?.response) {
         setMessages((prev) => [
           ...prev,
           {
             type: 'ai',
-            text: response.data.response.trim(),
+            text: session.response.trim(),
             timestamp: new Date(),
           },
         ])
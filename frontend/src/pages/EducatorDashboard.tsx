@@ -2,6 +2,7 @@ import { useState } from 'react'
 import { useQuery } from '@tanstack/react-query'
 import { lxpApiListStudents, lxpApiListLearningPaths } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { fetchAllPages } from '../utils/pagination'
 import CreateLearningPathModal from '../components/CreateLearningPathModal'
 import LearningPathDetailModal from '../components/LearningPathDetailModal'
 
@@ -30,8 +31,7 @@ export default function EducatorDashboard({ user, onLogout }: EducatorDashboardP
   const { data: studentsData, isLoading: studentsLoading } = useQuery({
     queryKey: ['students'],
     queryFn: async () => {
-      const response = await lxpApiListStudents()
-      return response.data?.items ?? []
+      return fetchAllPages((query) => lxpApiListStudents({ query }))
     },
   })
 
@@ -39,8 +39,7 @@ export default function EducatorDashboard({ user, onLogout }: EducatorDashboardP
   const { data: learningPathsData, isLoading: pathsLoading, refetch: refetchPaths } = useQuery({
     queryKey: ['learning-paths'],
     queryFn: async () => {
-      const response = await lxpApiListLearningPaths()
-      return response.data ?? []
+      return fetchAllPages((query) => lxpApiListLearningPaths({ query }))
     },
   })
 
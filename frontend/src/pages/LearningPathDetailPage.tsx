@@ -1,6 +1,7 @@
 import { useQuery } from '@tanstack/react-query'
 import { lxpApiGetLearningPath, lxpApiListProgress } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { fetchAllPages } from '../utils/pagination'
 
 interface LearningPathDetailPageProps {
   pathId: number
@@ -25,10 +26,9 @@ export default function LearningPathDetailPage({ pathId, onBack, onNavigateToCon
   const { data: progressData, isLoading: progressLoading } = useQuery({
     queryKey: ['progress', 'path', pathId],
     queryFn: async () => {
-      const response = await lxpApiListProgress({
-        query: { learning_path_id: pathId }
-      })
-      return response.data ?? []
+      return fetchAllPages((page) => lxpApiListProgress({
+        query: { learning_path_id: pathId, ...page }
+      }))
     },
   })
 
@@ -2,6 +2,7 @@ import { useState } from 'react'
 import { useQuery } from '@tanstack/react-query'
 import { lxpApiListLearningPaths, lxpApiListProgress } from '../generated/sdk.gen'
 import { client } from '../generated/client.gen'
+import { fetchAllPages } from '../utils/pagination'
 import AIMentorChat from '../components/AIMentorChat'
 
 interface User {
@@ -29,10 +30,9 @@ export default function StudentDashboard({ user, onLogout, onNavigateToLearningP
   const { data: learningPathsData, isLoading: pathsLoading } = useQuery({
     queryKey: ['learning-paths', user.profileId],
     queryFn: async () => {
-      const response = await lxpApiListLearningPaths({
-        query: { student_id: user.profileId },
-      })
-      return response.data ?? []
+      return fetchAllPages((page) => lxpApiListLearningPaths({
+        query: { student_id: user.profileId, ...page },
+      }))
     },
   })
 
@@ -40,10 +40,9 @@ export default function StudentDashboard({ user, onLogout, onNavigateToLearningP
   const { data: progressData, isLoading: progressLoading } = useQuery({
     queryKey: ['progress', user.profileId],
     queryFn: async () => {
-      const response = await lxpApiListProgress({
-        query: { student_id: user.profileId },
-      })
-      return response.data ?? []
+      return fetchAllPages((page) => lxpApiListProgress({
+        query: { student_id: user.profileId, ...page },
+      }))
     },
   })
 
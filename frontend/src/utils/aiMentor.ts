@@ -0,0 +1,67 @@
+import { client } from '../generated/client.gen'
+import { lxpApiChatWithAiMentor, lxpApiGetAiMentorSession } from '../generated/sdk.gen'
+import type { AiMentorChatInputSchema, AiMentorResponseOutputSchema } from '../generated/types.gen'
+
+const POLL_INTERVAL_MS = 1000
+const POLL_TIMEOUT_MS = 60000
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+/**
+ * Send a question to the AI mentor and wait for the response.
+ *
+ * The chat endpoint returns a pending session straight away while Grok's answer is
+ * generated in the background, so poll the session until it completes.
+ */
+export async function askAiMentor(body: AiMentorChatInputSchema): Promise<AiMentorResponseOutputSchema | undefined> {
+  const response = await lxpApiChatWithAiMentor({ body })
+  let session = response.data
+  const deadline = Date.now() + POLL_TIMEOUT_MS
+
+  while (session?.status === 'pending') {
+    if (Date.now() > deadline) {
+      throw new Error('AI mentor response timeout')
+    }
+    await sleep(POLL_INTERVAL_MS)
+    const poll = await lxpApiGetAiMentorSession({ path: { session_id: session.id } })
+    session = poll.data
+  }
+
+  if (session?.status === 'failed') {
+    throw new Error('AI mentor failed to respond')
+  }
+  return session
+}
+
+/**
+ * Send a question to the AI mentor and stream the answer as it is generated.
+ *
+ * onText is called with the full answer so far each time more text arrives; the
+ * complete answer is returned once the stream ends.
+ */
+export async function streamAiMentor(
+  body: AiMentorChatInputSchema,
+  onText: (text: string) => void,
+): Promise<string> {
+  const response = await fetch(`${client.getConfig().baseUrl}/api/ai-mentor/chat/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+  })
+  if (!response.ok || !response.body) {
+    throw new Error(`AI mentor stream failed (${response.status})`)
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let text = ''
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    text += decoder.decode(value, { stream: true })
+    onText(text)
+  }
+
+  return text + decoder.decode()
+}
@@ -0,0 +1,27 @@
+const PAGE_SIZE = 100
+
+type Page<T> = { items: Array<T>; count: number }
+
+/**
+ * Fetch every item of a paginated list endpoint.
+ *
+ * List endpoints return one limit/offset page at a time, so keep requesting the
+ * next page until count items have arrived.
+ */
+export async function fetchAllPages<T>(
+  fetchPage: (page: { limit: number; offset: number }) => Promise<{ data?: Page<T> }>,
+): Promise<Array<T>> {
+  const items: Array<T> = []
+
+  while (true) {
+    const response = await fetchPage({ limit: PAGE_SIZE, offset: items.length })
+    const page = response.data
+    if (!page || page.items.length === 0) {
+      return items
+    }
+    items.push(...page.items)
+    if (items.length >= page.count) {
+      return items
+    }
+  }
+}